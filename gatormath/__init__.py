@@ -51,6 +51,8 @@ Contents:
         - __version__: Package version string
         - __author__: Author information
         - __license__: License type
+        - core, geometry, precision, cli, web, utils: Subpackages, imported
+          on first attribute access (e.g. gatormath.geometry)
 
 Dependencies:
     - Python 3.9+ required
@@ -76,8 +78,16 @@ References:
 
 Notes:
     All public APIs are type-hinted and mypy-compliant
+    Subpackages load lazily, so `import gatormath` does not pull in Flask,
+    Rich, or NumPy
 """
 
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from gatormath import cli, core, geometry, precision, utils, web
+
 __version__ = "0.1.0"
 __author__ = "GatorMath Development Team"
 __license__ = "MIT"
@@ -87,3 +97,31 @@ __all__ = ["__version__", "__author__", "__license__"]
 __title__ = "gatormath"
 __description__ = "Mathematical precision with bite"
 __url__ = "https://github.com/dnoice/GatorMath"
+
+# Subpackages resolved on first attribute access (PEP 562)
+_LAZY_MAP = {
+    "core": "gatormath.core",
+    "geometry": "gatormath.geometry",
+    "precision": "gatormath.precision",
+    "cli": "gatormath.cli",
+    "web": "gatormath.web",
+    "utils": "gatormath.utils",
+}
+
+
+def __getattr__(name: str) -> ModuleType:
+    """
+    Import a subpackage on first access and cache it as a module attribute.
+
+    Raises:
+        AttributeError: If name is not a known subpackage
+
+    Version: 0.1.0
+    """
+    path = _LAZY_MAP.get(name)
+    if path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = __import__(path, fromlist=["_"])
+    globals()[name] = module
+    return module
@@ -22,6 +22,7 @@ Usage:
 Contents:
     Submodules:
         - app: Main Typer CLI application
+        - calculator: Safe expression evaluator for `calculate`
         - theme: Rich theme configuration
         - commands: CLI command modules
         - interactive: Interactive components
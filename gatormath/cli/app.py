@@ -18,23 +18,31 @@ Description:
 Usage:
     $ gatormath serve
     $ gatormath serve --port 8000
+    $ gatormath calculate "sqrt(144)"
+    $ gatormath geometry circle --radius 10
+    $ gatormath precision
     $ gatormath info
     $ gatormath version
 
 Contents:
     Commands:
         - serve: Launch Flask web application
+        - calculate: Evaluate a mathematical expression
+        - geometry: Display properties of a 2D shape
+        - precision: Demonstrate floating-point precision handling
         - info: Display package information
         - version: Display version
 
     Exports:
         - app: Typer application instance
+        - get_console: Shared themed Rich console (created on first use)
         - main: Main entry point
 
 Dependencies:
     - typer: CLI framework
     - rich: Beautiful terminal output
     - gatormath: Core functionality
+    - gatormath.cli.calculator: Expression evaluation for `calculate`
 
 Entry Point:
     Defined in pyproject.toml:
@@ -43,24 +51,172 @@ Entry Point:
 
 Notes:
     All commands use Rich for beautiful terminal output
+    Rich is imported lazily inside commands to keep CLI startup fast
 """
 
+import functools
+import os
 import sys
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, Union
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
 import gatormath
 
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.style import Style
+    from rich.table import Table
+    from rich.text import Text
+
 app = typer.Typer(
     name="gatormath",
     help="GatorMath - Mathematical precision with bite 🐊",
     add_completion=False,
 )
 
-console = Console()
+
+def get_console() -> "Console":
+    """
+    Return the shared Rich console, importing Rich on first use.
+
+    Rich is only needed once a command produces output, so deferring the
+    import keeps it off the startup path of `gatormath --help`.
+
+    Version: 0.1.0
+    """
+    from gatormath.cli.theme import create_console
+
+    return create_console()
+
+
+def _print_error(message: str) -> None:
+    """
+    Print an error message in red.
+
+    The message is printed with markup disabled, so user input echoed in it
+    (an expression, a shape name) is never parsed as Rich markup.
+
+    Version: 0.1.0
+    """
+    get_console().print(message, style="red", markup=False, highlight=False)
+
+
+@functools.lru_cache(maxsize=1)
+def _table_styles() -> Tuple["Style", "Style", "Style"]:
+    """Parse the (border, label, value) table styles once per process."""
+    from rich.style import Style
+
+    return Style.parse("green"), Style.parse("cyan"), Style.parse("white")
+
+
+def _make_props_table(title: str, headers: Tuple[str, str] = ("Property", "Value")) -> "Table":
+    """
+    Create an empty two-column table (label column, value column).
+
+    Version: 0.1.0
+    """
+    from rich.table import Table
+
+    border, label, value = _table_styles()
+    table = Table(title=title, border_style=border)
+    table.add_column(headers[0], style=label, no_wrap=True)
+    table.add_column(headers[1], style=value)
+    return table
+
+
+# Handlers for `geometry`: each builds one shape from the parsed options
+# and returns its (label, value) rows. shapes2d is imported on first use.
+_Options = Dict[str, Optional[float]]
+_Rows = List[Tuple[str, Union[str, "Text"]]]
+
+
+@functools.lru_cache(maxsize=2)
+def _yes_no(flag: bool) -> "Text":
+    """Return the shared styled Yes/No cell, skipping markup parsing per row."""
+    from rich.text import Text
+
+    return Text("Yes", style="success") if flag else Text("No", style="subtle")
+
+
+def _circle_rows(options: _Options) -> _Rows:
+    from gatormath.geometry.shapes2d import Circle
+
+    circle = Circle(radius=options["radius"])
+    return [
+        ("Radius", f"{circle.radius:.4f}"),
+        ("Diameter", f"{circle.diameter():.4f}"),
+        ("Circumference", f"{circle.circumference():.4f}"),
+        ("Area", f"{circle.area():.4f}"),
+    ]
+
+
+def _rectangle_rows(options: _Options) -> _Rows:
+    from gatormath.geometry.shapes2d import Rectangle
+
+    rect = Rectangle(width=options["width"], height=options["height"])
+    return [
+        ("Width", f"{rect.width:.4f}"),
+        ("Height", f"{rect.height:.4f}"),
+        ("Perimeter", f"{rect.perimeter():.4f}"),
+        ("Area", f"{rect.area():.4f}"),
+        ("Diagonal", f"{rect.diagonal():.4f}"),
+        ("Is Square", _yes_no(rect.is_square())),
+    ]
+
+
+def _square_rows(options: _Options) -> _Rows:
+    from gatormath.geometry.shapes2d import Square
+
+    square = Square(side=options["side"])
+    return [
+        ("Side", f"{square.side:.4f}"),
+        ("Perimeter", f"{square.perimeter():.4f}"),
+        ("Area", f"{square.area():.4f}"),
+        ("Diagonal", f"{square.diagonal():.4f}"),
+    ]
+
+
+def _triangle_rows(options: _Options) -> _Rows:
+    from gatormath.geometry.shapes2d import Triangle
+
+    triangle = Triangle(a=options["a"], b=options["b"], c=options["c"])
+    return [
+        ("Sides", f"{triangle.a:.4f}, {triangle.b:.4f}, {triangle.c:.4f}"),
+        ("Perimeter", f"{triangle.perimeter():.4f}"),
+        ("Area", f"{triangle.area():.4f}"),
+        ("Type", triangle.triangle_type().title()),
+        ("Right Triangle", _yes_no(triangle.is_right_triangle())),
+    ]
+
+
+# shape -> (table title, required options, missing-option error, row builder)
+_SHAPE_HANDLERS: Dict[str, Tuple[str, Tuple[str, ...], str, Callable[[_Options], _Rows]]] = {
+    "circle": (
+        "Circle Properties",
+        ("radius",),
+        "circle requires --radius",
+        _circle_rows,
+    ),
+    "rectangle": (
+        "Rectangle Properties",
+        ("width", "height"),
+        "rectangle requires --width and --height",
+        _rectangle_rows,
+    ),
+    "square": (
+        "Square Properties",
+        ("side",),
+        "square requires --side",
+        _square_rows,
+    ),
+    "triangle": (
+        "Triangle Properties",
+        ("a", "b", "c"),
+        "triangle requires -a, -b, and -c",
+        _triangle_rows,
+    ),
+}
 
 
 @app.command()
@@ -87,68 +243,232 @@ def serve(
 
     Version: 0.1.0
     """
-    console.print()
-    console.print(Panel.fit(
+    from rich.console import Group
+    from rich.panel import Panel
+
+    console = get_console()
+    console.print(Group("", Panel.fit(
         "[bold green]🐊 GatorMath Web Server[/bold green]\n"
         f"[cyan]Starting server on {host}:{port}...[/cyan]",
         border_style="green"
-    ))
-    console.print()
+    ), ""))
 
     try:
         from gatormath.web.app import create_app
 
         app_instance = create_app(config={"DEBUG": debug})
 
-        console.print(f"[green]✓[/green] Server running at: [bold cyan]http://localhost:{port}[/bold cyan]")
-        console.print(f"[green]✓[/green] Press [bold red]Ctrl+C[/bold red] to stop")
-        console.print()
+        console.print(
+            "[green]✓[/green] Server running at: "
+            f"[bold cyan]http://localhost:{port}[/bold cyan]\n"
+            "[green]✓[/green] Press [bold red]Ctrl+C[/bold red] to stop\n"
+        )
 
         app_instance.run(host=host, port=port, debug=debug)
 
     except KeyboardInterrupt:
         console.print("\n[yellow]Server stopped[/yellow]")
-        sys.exit(0)
+        raise typer.Exit()
     except Exception as e:
-        console.print(f"\n[red]Error starting server: {e}[/red]")
-        sys.exit(1)
+        console.print()
+        _print_error(f"Error starting server: {e}")
+        raise typer.Exit(code=1)
 
 
 @app.command()
-def info() -> None:
+def calculate(
+    expression: str = typer.Argument(..., help="Expression to evaluate, e.g. \"sqrt(144)\""),
+) -> None:
     """
-    Display package information.
+    Evaluate a mathematical expression.
 
-    Shows GatorMath version, description, and available modules.
+    Supports +, -, *, /, //, %, ^ (or **), parentheses, and the functions
+    sqrt, factorial, gcd, and lcm (gcd and lcm accept one or more
+    arguments).
+
+    Args:
+        expression: Expression to evaluate
+
+    Algorithm:
+        Delegates to gatormath.cli.calculator.evaluate(), which walks the
+        ast.parse() tree through fixed operator/function tables (no eval())
 
     Examples:
-        $ gatormath info
+        $ gatormath calculate "sqrt(144)"
+        $ gatormath calculate "gcd(48, 18) + 2^3"
+        $ gatormath calculate "lcm(4, 6, 10)"
 
     Version: 0.1.0
     """
-    table = Table(title="GatorMath Package Information", border_style="green")
+    from rich.text import Text
 
-    table.add_column("Property", style="cyan", no_wrap=True)
-    table.add_column("Value", style="white")
+    from gatormath.cli.calculator import evaluate
 
-    table.add_row("Package", "gatormath")
-    table.add_row("Version", gatormath.__version__)
-    table.add_row("Description", gatormath.__description__)
-    table.add_row("Author", gatormath.__author__)
-    table.add_row("License", gatormath.__license__)
-    table.add_row("URL", gatormath.__url__)
+    console = get_console()
+    try:
+        # str() is inside the try: ints past sys.get_int_max_str_digits()
+        # raise ValueError on conversion
+        result = str(evaluate(expression))
+    except (
+        SyntaxError, ValueError, TypeError, ZeroDivisionError, OverflowError,
+        RecursionError, MemoryError,
+    ) as e:
+        _print_error(f"Error evaluating '{expression}': {e}")
+        raise typer.Exit(code=1)
 
-    console.print()
-    console.print(table)
-    console.print()
+    console.print(Text.assemble((expression, "cyan"), " = ", (result, "bold green")))
 
-    console.print("[bold green]Available Modules:[/bold green]")
-    console.print("  • [cyan]core[/cyan]      - Mathematical operations")
-    console.print("  • [cyan]geometry[/cyan]  - Geometric shapes and algorithms")
-    console.print("  • [cyan]precision[/cyan] - Floating-point precision handling")
-    console.print("  • [cyan]web[/cyan]       - Flask web application")
-    console.print("  • [cyan]cli[/cyan]       - Command-line interface")
-    console.print()
+
+@app.command()
+def geometry(
+    shape: str = typer.Argument(..., help="Shape: circle, rectangle, square, or triangle"),
+    radius: Optional[float] = typer.Option(None, "--radius", "-r", help="Circle radius"),
+    width: Optional[float] = typer.Option(None, "--width", "-w", help="Rectangle width"),
+    height: Optional[float] = typer.Option(None, "--height", help="Rectangle height"),
+    side: Optional[float] = typer.Option(None, "--side", "-s", help="Square side length"),
+    a: Optional[float] = typer.Option(None, "-a", help="Triangle side a"),
+    b: Optional[float] = typer.Option(None, "-b", help="Triangle side b"),
+    c: Optional[float] = typer.Option(None, "-c", help="Triangle side c"),
+) -> None:
+    """
+    Display properties of a 2D shape.
+
+    Args:
+        shape: Shape name (circle, rectangle, square, triangle)
+        radius: Circle radius
+        width: Rectangle width
+        height: Rectangle height
+        side: Square side length
+        a: Triangle side a
+        b: Triangle side b
+        c: Triangle side c
+
+    Examples:
+        $ gatormath geometry circle --radius 10
+        $ gatormath geometry rectangle --width 4 --height 3
+        $ gatormath geometry square --side 2
+        $ gatormath geometry triangle -a 3 -b 4 -c 5
+
+    Version: 0.1.0
+    """
+    from rich.console import Group
+
+    console = get_console()
+    options = {
+        "radius": radius, "width": width, "height": height,
+        "side": side, "a": a, "b": b, "c": c,
+    }
+
+    try:
+        spec = _SHAPE_HANDLERS.get(shape.lower())
+        if spec is None:
+            raise ValueError(
+                f"Unknown shape '{shape}'. Choose circle, rectangle, square, or triangle"
+            )
+        title, required, missing, handler = spec
+        if any(options[name] is None for name in required):
+            raise ValueError(missing)
+        rows = handler(options)
+    except ValueError as e:
+        _print_error(f"Error: {e}")
+        raise typer.Exit(code=1)
+
+    table = _make_props_table(title)
+    for label, value in rows:
+        table.add_row(label, value)
+
+    console.print(Group("", table, ""))
+
+
+@app.command()
+def precision() -> None:
+    """
+    Demonstrate floating-point precision handling.
+
+    Shows why 0.1 + 0.2 != 0.3 with direct comparison and how the
+    gatormath.precision tolerance-based functions resolve it.
+
+    Examples:
+        $ gatormath precision
+
+    Version: 0.1.0
+    """
+    from rich.console import Group
+    from rich.text import Text
+
+    from gatormath.precision import compare, is_close, is_zero
+
+    total = 0.1 + 0.2
+    rows = [
+        ("0.1 + 0.2", repr(total)),
+        ("0.1 + 0.2 == 0.3", str(total == 0.3)),
+        ("abs(0.1 + 0.2 - 0.3)", f"{abs(total - 0.3):.2e}"),
+        ("is_close(0.1 + 0.2, 0.3)", str(is_close(total, 0.3))),
+        ("compare(0.1 + 0.2, 0.3)", str(compare(total, 0.3))),
+        ("is_zero(1e-15)", str(is_zero(1e-15))),
+    ]
+
+    table = _make_props_table("Floating-Point Precision", ("Expression", "Result"))
+    for expression, result in rows:
+        table.add_row(expression, result)
+
+    get_console().print(Group(
+        "",
+        table,
+        "",
+        Text.assemble(
+            ("✓", "green"), " Use ", ("is_close()", "cyan"), " instead of ",
+            ("==", "cyan"), " to compare floats",
+        ),
+        "",
+    ))
+
+
+# (module, description) rows listed by `info`
+_INFO_MODULES = (
+    ("core", "Mathematical operations"),
+    ("geometry", "Geometric shapes and algorithms"),
+    ("precision", "Floating-point precision handling"),
+    ("web", "Flask web application"),
+    ("cli", "Command-line interface"),
+)
+
+
+@app.command()
+def info() -> None:
+    """
+    Display package information.
+
+    Shows GatorMath version, description, and available modules.
+
+    Examples:
+        $ gatormath info
+
+    Version: 0.1.0
+    """
+    from rich.console import Group
+    from rich.text import Text
+
+    table = _make_props_table("GatorMath Package Information")
+    rows = (
+        ("Package", gatormath.__title__),
+        ("Version", gatormath.__version__),
+        ("Description", gatormath.__description__),
+        ("Author", gatormath.__author__),
+        ("License", gatormath.__license__),
+        ("URL", gatormath.__url__),
+    )
+    for row in rows:
+        table.add_row(*row)
+
+    modules = Text.assemble(("Available Modules:", "bold green"))
+    for name, description in _INFO_MODULES:
+        modules.append("\n  • ")
+        modules.append(name, style="cyan")
+        modules.append(" " * (9 - len(name)) + f" - {description}")
+
+    # Render everything as one group so the output is emitted in a single write
+    get_console().print(Group("", table, "", modules, ""))
 
 
 @app.command()
@@ -161,7 +481,9 @@ def version() -> None:
 
     Version: 0.1.0
     """
-    console.print(f"\n[bold green]GatorMath[/bold green] version [cyan]{gatormath.__version__}[/cyan]\n")
+    get_console().print(
+        f"\n[bold green]GatorMath[/bold green] version [cyan]{gatormath.__version__}[/cyan]\n"
+    )
 
 
 def main() -> None:
@@ -170,11 +492,25 @@ def main() -> None:
 
     Called when running `gatormath` command.
 
+    Notes:
+        `gatormath version` is answered directly, without Click's argument
+        parsing or Rich, since it only prints a constant. Set
+        GATORMATH_NO_FASTPATH=1 to route it through Typer like any other
+        command
+
     Examples:
         $ gatormath --help
 
     Version: 0.1.0
     """
+    if (
+        len(sys.argv) == 2
+        and sys.argv[1] == "version"
+        and not os.environ.get("GATORMATH_NO_FASTPATH")
+    ):
+        sys.stdout.write(f"\nGatorMath version {gatormath.__version__}\n\n")
+        return
+
     app()
 
 
@@ -0,0 +1,204 @@
+"""
+Metadata:
+    Project: GatorMath
+    File Name: calculator.py
+    File Path: gatormath/cli/calculator.py
+    Module: CLI Expression Calculator
+    Created: 2026-10-16
+    Modified: 2026-10-16
+    Version: 0.1.0
+    Author: Dennis 'dnoice' Smaltz
+    AI Acknowledgement: Claude Code
+
+Description:
+    Safe evaluator for the `gatormath calculate` command. Expressions are
+    parsed with ast.parse() and walked against fixed tables of operators and
+    GatorMath functions, so no arbitrary code is ever executed.
+
+Usage:
+    >>> from gatormath.cli.calculator import evaluate
+    >>> evaluate("sqrt(144)")
+    12.0
+
+    >>> evaluate("gcd(48, 18) + 2^3")
+    14.0
+
+Contents:
+    Functions:
+        - evaluate: Evaluate an arithmetic expression string
+
+Dependencies:
+    - ast: Expression parsing
+    - operator: Built-in operator functions
+    - gatormath.core.arithmetic: Safe arithmetic operations
+
+Notes:
+    Imported lazily by the `calculate` command so other commands do not pay
+    for ast and arithmetic at startup
+    Supported syntax: +, -, *, /, //, %, ^ (or **), parentheses, and the
+    functions sqrt, factorial, gcd, lcm (gcd and lcm take one or more
+    arguments). Integer +, -, * and // stay exact; with a float operand
+    they raise OverflowError rather than returning inf, like /, % and ^
+"""
+
+import ast
+import functools
+import operator
+from typing import Callable, Union
+
+from gatormath.core import arithmetic
+
+
+def _variadic(func: Callable[[int, int], int], identity: int) -> Callable[..., int]:
+    """
+    Extend a binary integer function to any number of arguments.
+
+    Folds the arguments left to right with functools.reduce(), starting
+    from the function's identity element so every argument is validated.
+    At least one argument is required.
+
+    Version: 0.1.0
+    """
+    def fold(*values: int) -> int:
+        if not values:
+            raise ValueError(f"{func.__name__} requires at least one argument")
+        return functools.reduce(func, values, identity)
+
+    return fold
+
+
+def _exact_or_safe(
+    int_op: Callable[[int, int], int],
+    safe_op: Callable[[float, float], float],
+) -> Callable[[Union[int, float], Union[int, float]], Union[int, float]]:
+    """
+    Combine an exact integer operator with its overflow-checked counterpart.
+
+    Two ints use int_op, so integer results stay exact at any size; any
+    float operand goes through safe_op, which raises OverflowError instead
+    of returning inf.
+
+    Version: 0.1.0
+    """
+    def apply(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
+        if isinstance(a, int) and isinstance(b, int):
+            return int_op(a, b)
+        return safe_op(a, b)
+
+    return apply
+
+
+def _safe_floordiv(a: float, b: float) -> float:
+    """Floor division with the overflow check of safe_divmod()."""
+    return arithmetic.safe_divmod(a, b)[0]
+
+
+# Dispatch tables, built once at import
+_FUNC_TABLE = {
+    "sqrt": arithmetic.safe_sqrt,
+    "factorial": arithmetic.factorial,
+    "gcd": _variadic(arithmetic.gcd, 0),
+    "lcm": _variadic(arithmetic.lcm, 1),
+}
+
+_BIN_OPS = {
+    ast.Add: _exact_or_safe(operator.add, arithmetic.safe_add),
+    ast.Sub: _exact_or_safe(operator.sub, arithmetic.safe_subtract),
+    ast.Mult: _exact_or_safe(operator.mul, arithmetic.safe_multiply),
+    ast.Div: arithmetic.safe_divide,
+    ast.FloorDiv: _exact_or_safe(operator.floordiv, _safe_floordiv),
+    ast.Mod: arithmetic.safe_mod,
+    ast.Pow: arithmetic.safe_power,
+}
+
+_UNARY_OPS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+
+class _ExpressionEvaluator(ast.NodeVisitor):
+    """
+    Evaluate a parsed arithmetic expression tree.
+
+    Only numeric literals, the operators in _BIN_OPS/_UNARY_OPS, and calls
+    to the functions in _FUNC_TABLE are accepted; any other node raises
+    ValueError, so no arbitrary code is ever executed.
+
+    Version: 0.1.0
+    """
+
+    def visit_Expression(self, node: ast.Expression) -> float:
+        return self.visit(node.body)
+
+    def visit_Constant(self, node: ast.Constant) -> float:
+        if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+            raise ValueError(f"Unsupported literal: {node.value!r}")
+        return node.value
+
+    def visit_BinOp(self, node: ast.BinOp) -> float:
+        op = _BIN_OPS.get(type(node.op))
+        if op is None:
+            raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
+        return op(self.visit(node.left), self.visit(node.right))
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> float:
+        op = _UNARY_OPS.get(type(node.op))
+        if op is None:
+            raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
+        return op(self.visit(node.operand))
+
+    def visit_Call(self, node: ast.Call) -> float:
+        func = _FUNC_TABLE.get(node.func.id) if isinstance(node.func, ast.Name) else None
+        if func is None or node.keywords:
+            raise ValueError(f"Unsupported function call: {ast.unparse(node.func)}")
+        return func(*(self.visit(arg) for arg in node.args))
+
+    def generic_visit(self, node: ast.AST) -> float:
+        raise ValueError(f"Unsupported expression element: {type(node).__name__}")
+
+
+_EVALUATOR = _ExpressionEvaluator()
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_expression(expression: str) -> ast.Expression:
+    """
+    Parse a calculator expression into an AST, caching by expression string.
+
+    Raises:
+        SyntaxError: If the expression is not valid Python expression syntax
+
+    Version: 0.1.0
+    """
+    return ast.parse(expression.replace("^", "**"), mode="eval")
+
+
+def evaluate(expression: str) -> Union[int, float]:
+    """
+    Evaluate an arithmetic expression string.
+
+    Args:
+        expression (str): Expression using numbers, + - * / // % ^ **,
+            parentheses, and sqrt/factorial/gcd/lcm calls
+
+    Returns:
+        Union[int, float]: Value of the expression
+
+    Raises:
+        SyntaxError: If the expression cannot be parsed
+        ValueError: If the expression uses unsupported syntax or invalid
+            function arguments (including gcd() or lcm() with no arguments)
+        ZeroDivisionError: If the expression divides by zero
+        OverflowError: If the result exceeds float range
+
+    Examples:
+        >>> evaluate("2 * (3 + 4)")
+        14
+
+        >>> evaluate("lcm(4, 6, 10)")
+        60
+
+    Version: 0.1.0
+    """
+    return _EVALUATOR.visit(_parse_expression(expression))
@@ -0,0 +1,110 @@
+"""
+Metadata:
+    Project: GatorMath
+    File Name: theme.py
+    File Path: gatormath/cli/theme.py
+    Module: CLI Theme
+    Created: 2026-10-16
+    Modified: 2026-10-16
+    Version: 0.1.0
+    Author: Dennis 'dnoice' Smaltz
+    AI Acknowledgement: Claude Code
+
+Description:
+    Rich theme configuration for the GatorMath CLI. Defines the brand color
+    palette and semantic styles from docs/BRANDING.md and provides the shared
+    themed console used by all commands.
+
+Usage:
+    >>> from gatormath.cli.theme import create_console
+    >>> console = create_console()
+    >>> console.print("[header]GatorMath[/header]")
+    GatorMath
+
+Contents:
+    Constants:
+        - GATOR_COLORS: Read-only mapping of brand color names to hex codes
+        - GATOR_THEME: Prebuilt Rich Theme of brand and semantic styles
+
+    Functions:
+        - create_console: Return the shared themed Rich console
+
+Dependencies:
+    - functools: Console memoization
+    - os, sys: Terminal detection for piped output
+    - types: Read-only style mapping
+    - rich: Console and Theme
+
+Notes:
+    Style names follow the CLI Color Usage Matrix in docs/BRANDING.md
+"""
+
+import functools
+import os
+import sys
+from types import MappingProxyType
+
+from rich.console import Console
+from rich.theme import Theme
+
+# Brand palette (docs/BRANDING.md), read-only so it cannot drift at runtime
+GATOR_COLORS = MappingProxyType({
+    "gator_green": "#2D5016",
+    "gator_teal": "#0D7377",
+    "gator_orange": "#FF8C42",
+    "gator_red": "#C1292E",
+    "gator_gold": "#F4D35E",
+    "gator_slate": "#E8E9EB",
+    "gator_charcoal": "#1A1D1E",
+    "gator_mist": "#6B7280",
+})
+
+_STYLES = MappingProxyType({
+    **GATOR_COLORS,
+    # Semantic styles
+    "header": f"bold {GATOR_COLORS['gator_green']}",
+    "success": f"bold {GATOR_COLORS['gator_green']}",
+    "info": GATOR_COLORS["gator_gold"],
+    "warning": f"bold {GATOR_COLORS['gator_orange']}",
+    "error": f"bold {GATOR_COLORS['gator_red']}",
+    "prompt": f"bold {GATOR_COLORS['gator_teal']}",
+    "data": GATOR_COLORS["gator_slate"],
+    "subtle": GATOR_COLORS["gator_mist"],
+    "highlight": f"on {GATOR_COLORS['gator_teal']}",
+})
+
+GATOR_THEME = Theme(_STYLES)
+
+
+@functools.lru_cache(maxsize=1)
+def create_console() -> Console:
+    """
+    Return the shared themed Rich console.
+
+    Returns:
+        Console: Rich console configured with GATOR_THEME
+
+    Notes:
+        Memoized: the console is built once per process; GATOR_THEME is
+        parsed at import. When stdout is not a terminal the console size is
+        pinned (COLUMNS/LINES, else 80x25) so Rich never probes the terminal
+        on print, and highlighting is disabled since it would be stripped
+
+    Examples:
+        >>> console = create_console()
+        >>> console is create_console()
+        True
+
+    Version: 0.1.0
+    """
+    if sys.stdout.isatty():
+        return Console(theme=GATOR_THEME)
+
+    columns = os.environ.get("COLUMNS", "")
+    lines = os.environ.get("LINES", "")
+    return Console(
+        theme=GATOR_THEME,
+        width=int(columns) if columns.isdigit() else 80,
+        height=int(lines) if lines.isdigit() else 25,
+        highlight=False,
+    )
@@ -23,6 +23,7 @@ Usage:
 Contents:
     Submodules:
         - arithmetic: Safe arithmetic operations with overflow detection
+        - batch: NumPy array versions of the safe_* operations (import on demand)
         - algebra: Algebraic operations (future)
         - calculus: Calculus operations (future)
         - statistics: Statistical functions (future)
@@ -0,0 +1,75 @@
+"""
+Metadata:
+    Project: GatorMath
+    File Name: _fastpath.py
+    File Path: gatormath/core/_fastpath.py
+    Module: Number Theory Kernels
+    Created: 2026-10-16
+    Modified: 2026-10-16
+    Version: 0.1.0
+    Author: Dennis 'dnoice' Smaltz
+    AI Acknowledgement: Claude Code
+
+Description:
+    Numba-compiled trial-division kernel behind the number theory functions
+    of gatormath.core.arithmetic. The loop runs as machine code on int64
+    instead of one bytecode dispatch per candidate divisor.
+
+Usage:
+    >>> from gatormath.core import _fastpath
+    >>> if _fastpath.HAS_NUMBA:
+    ...     _fastpath.smallest_factor(1_000_036_000_099, 7, 1_000_017)
+    1000003
+
+Contents:
+    Constants:
+        - HAS_NUMBA: True if Numba is available
+
+    Functions:
+        - smallest_factor: Smallest factor between a start divisor and a
+          limit, by trial division over the mod-30 wheel, for n < 2**63
+
+Dependencies:
+    - numpy: Wheel tables
+    - numba: JIT compilation (pip install gatormath[fast])
+
+Notes:
+    Private module: inputs are assumed validated and within int64 range.
+    The kernel is only defined when HAS_NUMBA is True; arithmetic.py
+    imports this module lazily, for large inputs only, so the Numba import
+    and JIT cost is never paid by small calls. Compiled code is cached on
+    disk (cache=True), so the compile happens once per install, not per
+    process. The caller passes the loop bound (at most isqrt(n)), so the
+    loop does one division per candidate and no multiply.
+"""
+
+import numpy as np
+
+try:
+    import numba
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+# Gaps between consecutive residues coprime to 30, starting from 7, and the
+# gap index for each such residue
+_WHEEL_30 = np.array([4, 2, 4, 2, 4, 6, 2, 6], dtype=np.int64)
+_WHEEL_INDEX = np.zeros(30, dtype=np.int64)
+_WHEEL_INDEX[[7, 11, 13, 17, 19, 23, 29, 1]] = np.arange(8)
+
+
+if HAS_NUMBA:
+
+    @numba.njit(cache=True)
+    def smallest_factor(n: int, divisor: int, limit: int) -> int:
+        # n and divisor coprime to 30; returns the first wheel candidate
+        # past limit if n has no factor in [divisor, limit]
+        step = _WHEEL_INDEX[divisor % 30]
+        while divisor <= limit:
+            if n % divisor == 0:
+                return divisor
+            divisor += _WHEEL_30[step]
+            step = (step + 1) & 7
+        return divisor
@@ -92,6 +92,7 @@ Contents:
         - safe_power: Exponentiation with overflow checking
         - safe_sqrt: Square root with negative checking
         - safe_mod: Modulo with zero checking
+        - safe_divmod: Floor quotient and remainder with zero checking
 
     Integer Functions:
         - factorial: Factorial calculation
@@ -110,6 +111,7 @@ Contents:
         - round_half_up: Standard rounding (ties away from zero)
         - round_half_even: Banker's rounding (ties to even)
         - round_to_digits: Flexible rounding with method selection
+        - make_rounder: Rounding function specialized for fixed decimals/method
 
     Root Operations:
         - nth_root: Compute nth root of a value
@@ -136,13 +138,18 @@ Contents:
         - lerp: Linear interpolation between two values
 
 Dependencies:
+    - functools: Partial application for rounding dispatch, memoization
+    - itertools, operator: Factorial table construction
+    - array: Compact smallest-prime-factor table
     - math: Standard library math functions
     - sys: System-specific parameters (float limits)
     - typing: Type hints
+    - gatormath.core._fastpath: Optional Numba kernels for large number
+      theory inputs (pip install gatormath[fast]), imported on first use
 
 Algorithm Complexity:
     - Basic operations (add, sub, mul, div): O(1)
-    - factorial: O(n)
+    - factorial: O(n) multiplications (balanced product tree in math.factorial)
     - gcd: O(log(min(a, b)))
     - lcm: O(log(min(a, b)))
 
@@ -153,11 +160,23 @@ References:
 Notes:
     All operations check for overflow and special cases (NaN, infinity)
     Follows IEEE 754 floating-point arithmetic standard
+    Infinite operands propagate as in IEEE 754 (inf + 1 == inf); only a
+    finite computation that overflows raises OverflowError
+    The safe_* guards test NaN as `x != x` (NaN is the only value unequal to
+    itself), avoiding a math.isnan() call per operand
+    Miller-Rabin results and factorizations are memoized (LRU, 4096 entries
+    each), so repeated number theory queries on the same n are lookups
+    Below 10⁶ primality and factoring read a smallest-prime-factor table
+    (2 MB, built once on first use)
 """
 
+import functools
+import itertools
 import math
+import operator
 import sys
-from typing import Union
+from array import array
+from typing import Callable, Optional, Tuple, Union
 
 # Type alias for numeric types
 Number = Union[int, float]
@@ -167,6 +186,21 @@ FLOAT_MAX = sys.float_info.max
 FLOAT_MIN = sys.float_info.min
 EPSILON = sys.float_info.epsilon
 
+# Scaling factors 10**decimals for the rounding functions, precomputed for
+# |decimals| <= 22 (10**22 is the largest power of ten exact as a float)
+_POW10 = {i: 10 ** i for i in range(-22, 23)}
+
+# 0! .. 170!: factorial() indexes this instead of recomputing (171! is the
+# first factorial beyond float range)
+_FACTORIALS = tuple(itertools.accumulate(range(1, 171), operator.mul, initial=1))
+
+# Number theory inputs in [_JIT_MIN_N, _JIT_MAX_N) go to the Numba kernels in
+# gatormath.core._fastpath when available; below the lower bound the Python
+# loop finishes before the compiled call pays off, above the upper bound n
+# does not fit in int64
+_JIT_MIN_N = 1 << 20
+_JIT_MAX_N = 1 << 63
+
 
 def safe_add(a: Number, b: Number) -> float:
     """
@@ -180,7 +214,7 @@ def safe_add(a: Number, b: Number) -> float:
         float: Sum of a and b
 
     Raises:
-        OverflowError: If result exceeds float range
+        OverflowError: If finite operands give a result beyond float range
         ValueError: If either operand is NaN
 
     Complexity:
@@ -194,17 +228,20 @@ def safe_add(a: Number, b: Number) -> float:
         >>> safe_add(0.1, 0.2)
         0.30000000000000004
 
+        >>> safe_add(float('inf'), 1.0)
+        inf
+
     Version: 0.1.0
     """
-    if math.isnan(a) or math.isnan(b):
+    if a != a or b != b:
         raise ValueError("Cannot add NaN values")
 
-    result = float(a) + float(b)
+    result = a + b
 
-    if math.isinf(result):
+    if math.isinf(result) and math.isfinite(a) and math.isfinite(b):
         raise OverflowError(f"Addition overflow: {a} + {b}")
 
-    return result
+    return float(result)
 
 
 def safe_subtract(a: Number, b: Number) -> float:
@@ -219,7 +256,7 @@ def safe_subtract(a: Number, b: Number) -> float:
         float: Difference of a and b
 
     Raises:
-        OverflowError: If result exceeds float range
+        OverflowError: If finite operands give a result beyond float range
         ValueError: If either operand is NaN
 
     Complexity:
@@ -232,15 +269,15 @@ def safe_subtract(a: Number, b: Number) -> float:
 
     Version: 0.1.0
     """
-    if math.isnan(a) or math.isnan(b):
+    if a != a or b != b:
         raise ValueError("Cannot subtract NaN values")
 
-    result = float(a) - float(b)
+    result = a - b
 
-    if math.isinf(result):
+    if math.isinf(result) and math.isfinite(a) and math.isfinite(b):
         raise OverflowError(f"Subtraction overflow: {a} - {b}")
 
-    return result
+    return float(result)
 
 
 def safe_multiply(a: Number, b: Number) -> float:
@@ -255,7 +292,7 @@ def safe_multiply(a: Number, b: Number) -> float:
         float: Product of a and b
 
     Raises:
-        OverflowError: If result exceeds float range
+        OverflowError: If finite operands give a result beyond float range
         ValueError: If either operand is NaN
 
     Complexity:
@@ -268,15 +305,15 @@ def safe_multiply(a: Number, b: Number) -> float:
 
     Version: 0.1.0
     """
-    if math.isnan(a) or math.isnan(b):
+    if a != a or b != b:
         raise ValueError("Cannot multiply NaN values")
 
-    result = float(a) * float(b)
+    result = a * b
 
-    if math.isinf(result):
+    if math.isinf(result) and math.isfinite(a) and math.isfinite(b):
         raise OverflowError(f"Multiplication overflow: {a} * {b}")
 
-    return result
+    return float(result)
 
 
 def safe_divide(a: Number, b: Number) -> float:
@@ -292,7 +329,7 @@ def safe_divide(a: Number, b: Number) -> float:
 
     Raises:
         ZeroDivisionError: If denominator is zero
-        OverflowError: If result exceeds float range
+        OverflowError: If finite operands give a result beyond float range
         ValueError: If either operand is NaN
 
     Precision:
@@ -313,15 +350,16 @@ def safe_divide(a: Number, b: Number) -> float:
 
     Version: 0.1.0
     """
-    if math.isnan(a) or math.isnan(b):
+    if a != a or b != b:
         raise ValueError("Cannot divide NaN values")
 
-    if b == 0:
+    if not b:
         raise ZeroDivisionError("Division by zero")
 
-    result = float(a) / float(b)
+    # True division always yields a float
+    result = a / b
 
-    if math.isinf(result):
+    if math.isinf(result) and math.isfinite(a) and math.isfinite(b):
         raise OverflowError(f"Division overflow: {a} / {b}")
 
     return result
@@ -353,15 +391,32 @@ def safe_power(base: Number, exponent: Number) -> float:
         >>> safe_power(4.0, 0.5)
         2.0
 
+        >>> safe_power(-8.0, 1 / 3)
+        Traceback (most recent call last):
+            ...
+        ValueError: Invalid power operation: -8.0^0.3333333333333333
+
+        >>> safe_power(2, 1e4)
+        Traceback (most recent call last):
+            ...
+        OverflowError: Power overflow: 2^10000.0
+
     Version: 0.1.0
     """
-    if math.isnan(base) or math.isnan(exponent):
+    if base != base or exponent != exponent:
         raise ValueError("Cannot compute power with NaN values")
 
+    # float ** float returns a complex number for a negative base with a
+    # fractional exponent, so reject that domain before computing
+    if base < 0 and math.isfinite(exponent) and not float(exponent).is_integer():
+        raise ValueError(f"Invalid power operation: {base}^{exponent}")
+
     try:
         result = float(base) ** float(exponent)
-    except ValueError as e:
-        raise ValueError(f"Invalid power operation: {base}^{exponent}") from e
+    except OverflowError:
+        # float.__pow__ raises (34, 'Numerical result out of range') for
+        # finite operands rather than returning inf
+        raise OverflowError(f"Power overflow: {base}^{exponent}") from None
 
     if math.isinf(result):
         raise OverflowError(f"Power overflow: {base}^{exponent}")
@@ -403,13 +458,13 @@ def safe_sqrt(value: Number) -> float:
 
     Version: 0.1.0
     """
-    if math.isnan(value):
+    if value != value:
         raise ValueError("Cannot compute square root of NaN")
 
     if value < 0:
         raise ValueError(f"Cannot compute square root of negative number: {value}")
 
-    return math.sqrt(float(value))
+    return math.sqrt(value)
 
 
 def safe_mod(a: Number, b: Number) -> float:
@@ -442,13 +497,67 @@ def safe_mod(a: Number, b: Number) -> float:
 
     Version: 0.1.0
     """
-    if math.isnan(a) or math.isnan(b):
+    if a != a or b != b:
         raise ValueError("Cannot compute modulo with NaN values")
 
-    if b == 0:
+    if not b:
         raise ZeroDivisionError("Modulo by zero")
 
-    return float(a) % float(b)
+    return float(a % b)
+
+
+def safe_divmod(a: Number, b: Number) -> Tuple[float, float]:
+    """
+    Safely compute floor quotient and remainder together.
+
+    Args:
+        a (Number): Dividend
+        b (Number): Divisor
+
+    Returns:
+        Tuple[float, float]: (a // b, a % b), with the remainder taking the
+            sign of the divisor as in Python's divmod()
+
+    Raises:
+        ZeroDivisionError: If divisor is zero
+        OverflowError: If finite operands give a quotient beyond float range
+        ValueError: If either operand is NaN
+
+    Algorithm:
+        One divmod() call, so the operands are validated once and the
+        division is done once, instead of separate floor-divide and
+        safe_mod() calls
+
+    Complexity:
+        Time: O(1)
+        Space: O(1)
+
+    Examples:
+        >>> safe_divmod(7.5, 2.0)
+        (3.0, 1.5)
+
+        >>> safe_divmod(-7, 2)
+        (-4.0, 1.0)
+
+        >>> safe_divmod(1.0, 0.0)
+        Traceback (most recent call last):
+            ...
+        ZeroDivisionError: Modulo by zero
+
+    Version: 0.1.0
+    """
+    if a != a or b != b:
+        raise ValueError("Cannot compute divmod with NaN values")
+
+    if not b:
+        raise ZeroDivisionError("Modulo by zero")
+
+    quotient, remainder = divmod(a, b)
+
+    if math.isinf(quotient) and math.isfinite(a):
+        raise OverflowError(f"Divmod overflow: {a} // {b}")
+
+    return float(quotient), float(remainder)
 
 
 def factorial(n: int) -> int:
@@ -467,11 +576,14 @@ def factorial(n: int) -> int:
         ValueError: If n is negative or not an integer
 
     Algorithm:
-        Uses math.factorial() for computation
+        For n <= 170, returns the value from a table built at import.
+        Otherwise uses math.factorial() (C implementation), which multiplies
+        the odd parts of n! with a divide-and-conquer product tree and
+        shifts in the power of two, keeping operands balanced for large n
 
     Complexity:
-        Time: O(n)
-        Space: O(1)
+        Time: O(n) multiplications on balanced operands
+        Space: O(n log n) bits for the result
 
     Examples:
         >>> factorial(5)
@@ -485,14 +597,23 @@ def factorial(n: int) -> int:
             ...
         ValueError: Factorial undefined for negative numbers
 
+        >>> factorial(200.0)
+        Traceback (most recent call last):
+            ...
+        ValueError: Factorial requires integer argument
+
     Version: 0.1.0
     """
+    # Checked here rather than left to math.factorial, which still accepts
+    # integral floats on Python 3.9
     if not isinstance(n, int):
         raise ValueError("Factorial requires integer argument")
 
+    # Table lookup for n <= 170
+    if 0 <= n < len(_FACTORIALS):
+        return _FACTORIALS[n]
     if n < 0:
         raise ValueError("Factorial undefined for negative numbers")
-
     return math.factorial(n)
 
 
@@ -508,7 +629,8 @@ def gcd(a: int, b: int) -> int:
         int: Greatest common divisor of a and b
 
     Algorithm:
-        Euclidean algorithm: gcd(a,b) = gcd(b, a mod b)
+        Uses math.gcd() (C implementation; Lehmer's algorithm for
+        multi-word integers, Euclidean gcd(a,b) = gcd(b, a mod b) otherwise)
 
     Complexity:
         Time: O(log(min(a, b)))
@@ -523,10 +645,10 @@ def gcd(a: int, b: int) -> int:
 
     Version: 0.1.0
     """
-    if not isinstance(a, int) or not isinstance(b, int):
-        raise ValueError("GCD requires integer arguments")
-
-    return math.gcd(a, b)
+    try:
+        return math.gcd(a, b)
+    except TypeError:
+        raise ValueError("GCD requires integer arguments") from None
 
 
 def lcm(a: int, b: int) -> int:
@@ -541,7 +663,8 @@ def lcm(a: int, b: int) -> int:
         int: Least common multiple of a and b
 
     Algorithm:
-        lcm(a,b) = abs(a*b) / gcd(a,b)
+        Uses math.lcm(): lcm(a,b) = abs(a // gcd(a,b) * b)
+        Dividing before multiplying avoids the full a*b intermediate
 
     Complexity:
         Time: O(log(min(a, b)))
@@ -556,10 +679,10 @@ def lcm(a: int, b: int) -> int:
 
     Version: 0.1.0
     """
-    if not isinstance(a, int) or not isinstance(b, int):
-        raise ValueError("LCM requires integer arguments")
-
-    return math.lcm(a, b)
+    try:
+        return math.lcm(a, b)
+    except TypeError:
+        raise ValueError("LCM requires integer arguments") from None
 
 
 def clamp(value: Number, min_val: Number, max_val: Number) -> float:
@@ -596,7 +719,11 @@ def clamp(value: Number, min_val: Number, max_val: Number) -> float:
     if min_val > max_val:
         raise ValueError(f"min_val ({min_val}) cannot be greater than max_val ({max_val})")
 
-    return max(min_val, min(value, max_val))
+    # Same result as max(min_val, min(value, max_val)) (NaN clamps to
+    # min_val) without the two builtin calls
+    if value > max_val:
+        value = max_val
+    return value if value > min_val else min_val
 
 
 def sign(value: Number) -> int:
@@ -647,7 +774,8 @@ def abs_value(value: Number) -> float:
         float: Absolute value of input (always non-negative)
 
     Algorithm:
-        Returns value if value >= 0, otherwise returns -value
+        Uses math.fabs(), which converts to float and clears the sign bit,
+        so NaN and signed zeros need no special-casing
 
     Complexity:
         Time: O(1)
@@ -679,10 +807,7 @@ def abs_value(value: Number) -> float:
 
     Version: 0.1.0
     """
-    if math.isnan(value):
-        return float('nan')
-
-    return float(abs(value))
+    return math.fabs(value)
 
 
 def floor(value: Number) -> float:
@@ -734,13 +859,10 @@ def floor(value: Number) -> float:
 
     Version: 0.1.0
     """
-    if math.isnan(value):
-        return float('nan')
-
-    if math.isinf(value):
-        return value
-
-    return float(math.floor(value))
+    # NaN and infinities pass through unchanged (math.floor rejects them)
+    if math.isfinite(value):
+        return float(math.floor(value))
+    return float(value)
 
 
 def ceil(value: Number) -> float:
@@ -792,13 +914,10 @@ def ceil(value: Number) -> float:
 
     Version: 0.1.0
     """
-    if math.isnan(value):
-        return float('nan')
-
-    if math.isinf(value):
-        return value
-
-    return float(math.ceil(value))
+    # NaN and infinities pass through unchanged (math.ceil rejects them)
+    if math.isfinite(value):
+        return float(math.ceil(value))
+    return float(value)
 
 
 def trunc(value: Number) -> float:
@@ -855,13 +974,10 @@ def trunc(value: Number) -> float:
 
     Version: 0.1.0
     """
-    if math.isnan(value):
-        return float('nan')
-
-    if math.isinf(value):
-        return value
-
-    return float(math.trunc(value))
+    # NaN and infinities pass through unchanged (math.trunc rejects them)
+    if math.isfinite(value):
+        return float(math.trunc(value))
+    return float(value)
 
 
 def round_half_up(value: Number, decimals: int = 0) -> float:
@@ -883,7 +999,7 @@ def round_half_up(value: Number, decimals: int = 0) -> float:
         float: Rounded value
 
     Algorithm:
-        1. Scale value by 10^decimals
+        1. Scale value by 10^decimals (precomputed for |decimals| <= 22)
         2. Add 0.5 * sign(value)
         3. Truncate to integer
         4. Scale back by 10^(-decimals)
@@ -919,6 +1035,7 @@ def round_half_up(value: Number, decimals: int = 0) -> float:
     See Also:
         - round_half_even: Banker's rounding (ties to even)
         - round_to_digits: Alias with explicit naming
+        - make_rounder: Specialized rounder for a fixed decimals
 
     Notes:
         Python's built-in round() uses half-even rounding, not half-up
@@ -938,8 +1055,17 @@ def round_half_up(value: Number, decimals: int = 0) -> float:
     if not isinstance(decimals, int):
         raise ValueError("Decimals must be an integer")
 
+    # Whole-number rounding needs no scaling
+    if decimals == 0:
+        if value >= 0:
+            return float(math.floor(value + 0.5))
+        return float(math.ceil(value - 0.5))
+
     # Calculate scaling factor
-    multiplier = 10 ** decimals
+    try:
+        multiplier = _POW10[decimals]
+    except KeyError:
+        multiplier = 10 ** decimals
 
     # Scale, round, and scale back
     scaled = value * multiplier
@@ -1014,6 +1140,7 @@ def round_half_even(value: Number, decimals: int = 0) -> float:
     See Also:
         - round_half_up: Standard rounding (ties away from zero)
         - round_to_digits: Alias for round_half_even
+        - make_rounder: Specialized rounder for a fixed decimals
 
     Notes:
         This is the default rounding in Python 3, IEEE 754, and most
@@ -1038,6 +1165,46 @@ def round_half_even(value: Number, decimals: int = 0) -> float:
     return float(round(value, decimals))
 
 
+def _round_directed(
+    operation: Callable[[Number], float], value: Number, decimals: int
+) -> float:
+    """
+    Apply math.floor, math.ceil, or math.trunc at the given decimal places.
+
+    Does the NaN/inf handling of floor(), ceil(), and trunc() once, so the
+    public wrappers are not re-entered for the scaled value.
+    """
+    if not math.isfinite(value):
+        # Like the other rounding functions, NaN/inf pass through unchecked
+        return value
+
+    if not isinstance(decimals, int):
+        raise ValueError("Decimals must be an integer")
+
+    if decimals == 0:
+        return float(operation(value))
+
+    try:
+        multiplier = _POW10[decimals]
+    except KeyError:
+        multiplier = 10 ** decimals
+
+    scaled = value * multiplier
+    if math.isinf(scaled):
+        return scaled / multiplier
+    return float(operation(scaled)) / multiplier
+
+
+# method -> rounding function(value, decimals) for round_to_digits
+_ROUNDING_METHODS = {
+    'half_even': round_half_even,
+    'half_up': round_half_up,
+    'floor': functools.partial(_round_directed, math.floor),
+    'ceil': functools.partial(_round_directed, math.ceil),
+    'trunc': functools.partial(_round_directed, math.trunc),
+}
+
+
 def round_to_digits(value: Number, decimals: int = 0, method: str = 'half_even') -> float:
     """
     Round value to specified decimal places using chosen method.
@@ -1102,46 +1269,118 @@ def round_to_digits(value: Number, decimals: int = 0, method: str = 'half_even')
 
     Version: 0.1.0
     """
-    if math.isnan(value):
-        return float('nan')
+    # NaN, infinity, and the decimals type are handled by each rounder
+    rounder = _ROUNDING_METHODS.get(method)
+    if rounder is None:
+        # Slow path: accept 'HALF-UP' style spellings
+        method = method.lower().replace('-', '_')
+        rounder = _ROUNDING_METHODS.get(method)
+        if rounder is None:
+            raise ValueError(
+                f"Unknown rounding method: '{method}'. "
+                f"Valid methods: 'half_even', 'half_up', 'floor', 'ceil', 'trunc'"
+            )
 
-    if math.isinf(value):
-        return value
+    return rounder(value, decimals)
+
+
+def make_rounder(decimals: int = 0, method: str = 'half_even') -> Callable[[Number], float]:
+    """
+    Build a rounding function specialized for fixed decimals and method.
+
+    Detailed Description:
+        Returns a one-argument function equivalent to
+        round_to_digits(value, decimals, method). The method name is
+        validated, and the scaling factor computed, once when the rounder is
+        built instead of on every call, which suits rounding many values to
+        the same precision.
+
+    Args:
+        decimals (int): Number of decimal places (default: 0)
+            - decimals >= 0: Round to that many decimal places
+            - decimals < 0: Round to left of decimal point
+        method (str): Rounding method (default: 'half_even')
+            - 'half_even', 'half_up', 'floor', 'ceil', or 'trunc'
+
+    Returns:
+        Callable[[Number], float]: Function rounding a single value
+
+    Raises:
+        ValueError: If decimals is not an integer or method is not recognized
+
+    Complexity:
+        Time: O(1) to build, O(1) per call
+        Space: O(1)
 
+    Examples:
+        >>> to_cents = make_rounder(2, 'half_up')
+        >>> to_cents(2.675), to_cents(-0.125)
+        (2.68, -0.13)
+
+        >>> to_tens = make_rounder(-1, 'floor')
+        >>> [to_tens(v) for v in (1234.5, -5.0)]
+        [1230.0, -10.0]
+
+        >>> make_rounder(2, 'floor')(1e308) == round_to_digits(1e308, 2, 'floor')
+        True
+
+    See Also:
+        - round_to_digits: One-off rounding with the same methods
+
+    Version: 0.1.0
+    """
     if not isinstance(decimals, int):
         raise ValueError("Decimals must be an integer")
 
-    # Normalize method name
     method = method.lower().replace('-', '_')
+    isfinite = math.isfinite
 
-    # Route to appropriate rounding function
     if method == 'half_even':
-        return round_half_even(value, decimals)
-    elif method == 'half_up':
-        return round_half_up(value, decimals)
-    elif method == 'floor':
-        if decimals == 0:
-            return floor(value)
-        else:
-            multiplier = 10 ** decimals
-            return floor(value * multiplier) / multiplier
-    elif method == 'ceil':
-        if decimals == 0:
-            return ceil(value)
-        else:
-            multiplier = 10 ** decimals
-            return ceil(value * multiplier) / multiplier
-    elif method == 'trunc':
-        if decimals == 0:
-            return trunc(value)
-        else:
-            multiplier = 10 ** decimals
-            return trunc(value * multiplier) / multiplier
-    else:
+        def rounder(value: Number) -> float:
+            if not isfinite(value):
+                return value
+            return float(round(value, decimals))
+
+        return rounder
+
+    try:
+        multiplier = _POW10[decimals]
+    except KeyError:
+        multiplier = 10 ** decimals
+
+    if method == 'half_up':
+        math_floor, math_ceil = math.floor, math.ceil
+
+        def rounder(value: Number) -> float:
+            if not isfinite(value):
+                return value
+            scaled = value * multiplier
+            if scaled >= 0:
+                rounded = math_floor(scaled + 0.5)
+            else:
+                rounded = math_ceil(scaled - 0.5)
+            return float(rounded / multiplier)
+
+        return rounder
+
+    operations = {'floor': math.floor, 'ceil': math.ceil, 'trunc': math.trunc}
+    if method not in operations:
         raise ValueError(
             f"Unknown rounding method: '{method}'. "
             f"Valid methods: 'half_even', 'half_up', 'floor', 'ceil', 'trunc'"
         )
+    operation = operations[method]
+
+    def rounder(value: Number) -> float:
+        if not isfinite(value):
+            return value
+        scaled = value * multiplier
+        if math.isinf(scaled):
+            # Overflowed scaling: same result as _round_directed()
+            return scaled / multiplier
+        return float(operation(scaled)) / multiplier
+
+    return rounder
 
 
 # ===== ROOT OPERATIONS =====
@@ -1260,19 +1499,42 @@ def nth_root(value: Number, n: int) -> float:
             raise ValueError("Cannot compute even root of negative infinity")
 
     # Handle negative values
-    if value < 0:
+    negative = value < 0
+    if negative:
         if n % 2 == 0:  # Even root
             raise ValueError(
                 f"Cannot compute even root of negative number: "
                 f"{n}th root of {value}"
             )
-        else:  # Odd root
-            # For odd roots, we can take the root of the absolute value
-            # and negate the result
-            return -float(abs(value) ** (1.0 / n))
+        # For odd roots, we can take the root of the absolute value
+        # and negate the result
+        value = -value
+
+    if not value:
+        return 0.0
+    if n == 2:
+        return math.sqrt(value)
+    if n == 3:
+        # cbrt() polishes with root * root instead of a second pow()
+        root = cbrt(value)
+        return -root if negative else root
+
+    root = value ** (1.0 / n)
+    if n & (n - 1):
+        # 1/n is inexact unless n is a power of two, which leaves pow() off
+        # by up to ~100 ulp for large |log(value)|; one Newton step on
+        # root**n - value brings it back within 1 ulp
+        root -= (root - value / root ** (n - 1)) / n
+
+    return -root if negative else float(root)
+
+
+def _cbrt_pow(value: float) -> float:
+    """Cube root of a finite float for Python < 3.11 (no math.cbrt)."""
+    return math.copysign(abs(value) ** (1.0 / 3.0), value)
 
-    # Handle non-negative values
-    return float(value ** (1.0 / n))
+
+_cbrt = getattr(math, "cbrt", _cbrt_pow)
 
 
 def cbrt(value: Number) -> float:
@@ -1291,9 +1553,9 @@ def cbrt(value: Number) -> float:
         float: Cube root of value (can be positive, negative, or zero)
 
     Algorithm:
-        For positive values: Uses value^(1/3)
-        For negative values: Returns -(|value|^(1/3))
-        For zero: Returns 0
+        Uses math.cbrt() (±|value|^(1/3) before Python 3.11), polished by
+        one Newton step
+        For zero: Returns 0 with the sign of value
 
     Complexity:
         Time: O(1) - Constant time computation
@@ -1336,6 +1598,7 @@ def cbrt(value: Number) -> float:
         - nth_root: General nth root function
         - safe_sqrt: Square root function
         - sqrt_newton: Newton-Raphson square root
+        - batch.cbrt_array: Element-wise cbrt over arrays
 
     Notes:
         - Cube root is defined for all real numbers
@@ -1359,18 +1622,14 @@ def cbrt(value: Number) -> float:
 
     Version: 0.3.0
     """
-    if math.isnan(value):
-        return float('nan')
-
-    if math.isinf(value):
-        return value  # Returns +inf for +inf, -inf for -inf
-
-    # Handle negative values
-    if value < 0:
-        return -float(abs(value) ** (1.0 / 3.0))
+    # NaN, infinities and signed zeros are their own cube roots
+    if not value or not math.isfinite(value):
+        return float(value)
 
-    # Handle non-negative values
-    return float(value ** (1.0 / 3.0))
+    # One Newton step as in nth_root(): the C library cbrt is not correctly
+    # rounded (cbrt(-27.0) can miss -3.0)
+    root = _cbrt(value)
+    return root - (root - value / (root * root)) / 3.0
 
 
 def sqrt_newton(
@@ -1404,7 +1663,8 @@ def sqrt_newton(
 
     Algorithm:
         Newton-Raphson iteration for f(x) = x² - value:
-        1. Start with initial guess x₀ = value / 2 (or 1 if value < 1)
+        1. Start with initial guess x₀ = (1 + M) / 2 × 2^k, where
+           value = M × 2^(2k) with 0.5 <= M < 2 (within 6% of the root)
         2. Iterate: x_{n+1} = (x_n + value/x_n) / 2
         3. Stop when |x_{n+1} - x_n| < tolerance or max iterations reached
 
@@ -1414,7 +1674,8 @@ def sqrt_newton(
 
     Convergence:
         - Quadratic convergence: Error roughly squares each iteration
-        - Typically converges in 4-6 iterations for double precision
+        - Typically converges in 3-5 iterations for double precision, at
+          any magnitude (the seed already has the right exponent)
         - Initial guess quality affects iteration count
 
     Special Cases:
@@ -1445,7 +1706,7 @@ def sqrt_newton(
             ...
         ValueError: Cannot compute square root of negative number
 
-        >>> sqrt_newton(2.0, max_iterations=3)
+        >>> sqrt_newton(2.0, max_iterations=1)
         1.4166666666666665
 
     See Also:
@@ -1499,11 +1760,11 @@ def sqrt_newton(
     if math.isinf(value):
         return float('inf')
 
-    # Initial guess: value/2 for large values, 1 for small values
-    if value >= 1:
-        x = value / 2.0
-    else:
-        x = 1.0
+    # Initial guess from the exponent: with value = m × 2^e, 0.5 <= m < 1,
+    # the root is √M × 2^(e // 2) for M = m × 2^(e % 2) in [0.5, 2), and
+    # (1 + M) / 2 approximates √M within 6%
+    mantissa, exponent = math.frexp(value)
+    x = math.ldexp(1.0 + math.ldexp(mantissa, exponent & 1), exponent // 2 - 1)
 
     # Newton-Raphson iteration
     for iteration in range(max_iterations):
@@ -1581,6 +1842,7 @@ def exp(value: Number) -> float:
         - ln: Natural logarithm (inverse of exp)
         - safe_power: General exponentiation
         - log: Logarithm with arbitrary base
+        - batch.exp_array: Element-wise exp over arrays
 
     Notes:
         - exp(x) is always positive for finite x
@@ -1610,22 +1872,12 @@ def exp(value: Number) -> float:
 
     Version: 0.4.0
     """
-    if math.isnan(value):
-        return float('nan')
-
-    if math.isinf(value):
-        if value > 0:
-            return float('inf')
-        else:  # -infinity
-            return 0.0
-
+    # math.exp already maps NaN to NaN, +inf to inf and -inf to 0.0
     try:
-        result = math.exp(float(value))
+        return math.exp(value)
     except OverflowError:
         raise OverflowError(f"Exponential overflow: e^{value} exceeds float range")
 
-    return float(result)
-
 
 def ln(value: Number) -> float:
     """
@@ -1693,6 +1945,7 @@ def ln(value: Number) -> float:
         - log2: Base-2 logarithm
         - log10: Base-10 logarithm
         - log: Logarithm with arbitrary base
+        - batch.ln_array: Element-wise ln over arrays
 
     Notes:
         - ln(x) is only defined for x > 0
@@ -1722,18 +1975,16 @@ def ln(value: Number) -> float:
 
     Version: 0.4.0
     """
+    # Positive values, +inf included, are valid; NaN fails the comparison
+    if value > 0:
+        return math.log(value)
+
     if math.isnan(value):
         raise ValueError("Natural logarithm undefined for NaN")
 
-    if value <= 0:
-        raise ValueError(
-            f"Natural logarithm undefined for non-positive values: {value}"
-        )
-
-    if math.isinf(value):
-        return float('inf')
-
-    return float(math.log(value))
+    raise ValueError(
+        f"Natural logarithm undefined for non-positive values: {value}"
+    )
 
 
 def log2(value: Number) -> float:
@@ -1804,6 +2055,7 @@ def log2(value: Number) -> float:
         - log10: Base-10 logarithm
         - log: Logarithm with arbitrary base
         - exp: Exponential function
+        - batch.log2_array: Element-wise log2 over arrays
 
     Notes:
         - log2(2^n) = n for any real n
@@ -1832,18 +2084,16 @@ def log2(value: Number) -> float:
 
     Version: 0.4.0
     """
+    # Positive values, +inf included, are valid; NaN fails the comparison
+    if value > 0:
+        return math.log2(value)
+
     if math.isnan(value):
         raise ValueError("Base-2 logarithm undefined for NaN")
 
-    if value <= 0:
-        raise ValueError(
-            f"Base-2 logarithm undefined for non-positive values: {value}"
-        )
-
-    if math.isinf(value):
-        return float('inf')
-
-    return float(math.log2(value))
+    raise ValueError(
+        f"Base-2 logarithm undefined for non-positive values: {value}"
+    )
 
 
 def log10(value: Number) -> float:
@@ -1914,6 +2164,7 @@ def log10(value: Number) -> float:
         - log2: Base-2 logarithm
         - log: Logarithm with arbitrary base
         - exp: Exponential function
+        - batch.log10_array: Element-wise log10 over arrays
 
     Notes:
         - log10(10^n) = n for any real n
@@ -1943,18 +2194,16 @@ def log10(value: Number) -> float:
 
     Version: 0.4.0
     """
+    # Positive values, +inf included, are valid; NaN fails the comparison
+    if value > 0:
+        return math.log10(value)
+
     if math.isnan(value):
         raise ValueError("Base-10 logarithm undefined for NaN")
 
-    if value <= 0:
-        raise ValueError(
-            f"Base-10 logarithm undefined for non-positive values: {value}"
-        )
-
-    if math.isinf(value):
-        return float('inf')
-
-    return float(math.log10(value))
+    raise ValueError(
+        f"Base-10 logarithm undefined for non-positive values: {value}"
+    )
 
 
 def log(value: Number, base: Number = math.e) -> float:
@@ -2037,6 +2286,7 @@ def log(value: Number, base: Number = math.e) -> float:
         - log2: Base-2 logarithm
         - log10: Base-10 logarithm
         - exp: Exponential function
+        - batch.log_array: Element-wise log over arrays
 
     Notes:
         - For common bases (2, 10, e), prefer specialized functions
@@ -2070,6 +2320,10 @@ def log(value: Number, base: Number = math.e) -> float:
 
     Version: 0.4.0
     """
+    # Finite positive value and base (NaN fails every comparison)
+    if 0 < value <= FLOAT_MAX and 0 < base <= FLOAT_MAX and base != 1:
+        return math.log(value, base)
+
     if math.isnan(value) or math.isnan(base):
         raise ValueError("Logarithm undefined for NaN")
 
@@ -2105,14 +2359,274 @@ def log(value: Number, base: Number = math.e) -> float:
 # ===== NUMBER THEORY OPERATIONS =====
 
 
+def _primes_below(limit: int) -> tuple:
+    """Return the primes below limit (sieve of Eratosthenes)."""
+    sieve = bytearray([1]) * limit
+    sieve[:2] = b"\x00\x00"
+    for i in range(2, math.isqrt(limit - 1) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = bytes(len(range(i * i, limit, i)))
+    return tuple(i for i in range(limit) if sieve[i])
+
+
+_SMALL_PRIMES = _primes_below(1000)
+_SMALL_PRIME_SET = frozenset(_SMALL_PRIMES)
+# One gcd() with the product of all small primes screens out most composites
+_SMALL_PRIMORIAL = math.prod(_SMALL_PRIMES)
+
+# (bound, k): the first k primes are a deterministic Miller-Rabin witness set
+# for every n < bound (Jaeschke 1993; Sorenson & Webster 2015)
+_MILLER_RABIN_BOUNDS = (
+    (2_047, 1),
+    (1_373_653, 2),
+    (25_326_001, 3),
+    (3_215_031_751, 4),
+    (2_152_302_898_747, 5),
+    (3_474_749_660_383, 6),
+    (341_550_071_728_321, 7),
+    (3_825_123_056_546_413_051, 9),
+    (318_665_857_834_031_151_167_461, 12),
+    (3_317_044_064_679_887_385_961_981, 13),
+)
+
+# Gaps between consecutive residues coprime to 30, starting from 7
+_WHEEL_30 = (4, 2, 4, 2, 4, 6, 2, 6)
+
+# Exclusive bound of the smallest-prime-factor table; _SMALL_PRIMES must
+# hold every prime up to its square root
+_SIEVE_LIMIT = 1_000_000
+
+# Largest trial divisor before _prime_factors hands a composite cofactor to
+# Pollard's rho. The Numba kernel finds factors below 2**16 about 10x faster
+# than rho and wastes at most ~0.1 ms scanning when there are none; past
+# about 2**17, rho wins
+_TRIAL_DIVISION_BOUND = 1 << 10
+_TRIAL_DIVISION_BOUND_JIT = 1 << 16
+
+# Steps of the rho walk whose differences share one gcd() call
+_RHO_BATCH = 128
+
+
+@functools.lru_cache(maxsize=1)
+def _smallest_prime_factors() -> array:
+    """Smallest prime factor of each n below _SIEVE_LIMIT, 0 if n is prime."""
+    spf = array("H", bytes(2 * _SIEVE_LIMIT))
+    # Largest prime first, so smaller primes overwrite the shared multiples
+    for p in reversed(_SMALL_PRIMES):
+        spf[p * p::p] = array("H", [p]) * len(range(p * p, _SIEVE_LIMIT, p))
+    return spf
+
+
+def _number_theory_kernels():
+    """Return gatormath.core._fastpath if Numba is available, else None."""
+    from gatormath.core import _fastpath
+
+    return _fastpath if _fastpath.HAS_NUMBA else None
+
+
+def _is_prime(n: int) -> bool:
+    """Primality test for an int n >= 2 (Miller-Rabin, see is_prime)."""
+    if n < 1000:
+        return n in _SMALL_PRIME_SET
+    if n < _SIEVE_LIMIT:
+        return not _smallest_prime_factors()[n]
+    if math.gcd(n, _SMALL_PRIMORIAL) != 1:
+        return False
+    return _miller_rabin(n)
+
+
+@functools.lru_cache(maxsize=4096)
+def _miller_rabin(n: int) -> bool:
+    """Deterministic Miller-Rabin for an n >= 1000 with no factor below 1000."""
+    # n - 1 = d * 2**s with d odd
+    d = n - 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+
+    for bound, count in _MILLER_RABIN_BOUNDS:
+        if n < bound:
+            break
+    proven = n < bound
+
+    for a in _SMALL_PRIMES[:count]:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+
+    # Beyond the deterministic range a passing n is only a strong probable
+    # prime; the strong Lucas test completes Baillie-PSW (base 2 is among
+    # the witnesses above)
+    return proven or _strong_lucas(n)
+
+
+def _jacobi(a: int, n: int) -> int:
+    """Jacobi symbol (a/n) for an odd n > 0."""
+    a %= n
+    result = 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def _strong_lucas(n: int) -> bool:
+    """Strong Lucas probable-prime test for an odd n with no factor below 1000."""
+    # Selfridge's parameters: first D in 5, -7, 9, -11, ... with (D/n) = -1.
+    # No such D exists when n is a perfect square
+    if math.isqrt(n) ** 2 == n:
+        return False
+    D = 5
+    while _jacobi(D, n) != -1:
+        D = -D - 2 if D > 0 else -D + 2
+    Q = (1 - D) // 4
+
+    # n + 1 = d * 2**s with d odd
+    d = n + 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+
+    # Lucas sequences with P = 1, from U_1 = 1, V_1 = 1 up the bits of d
+    U, V, Qk = 1, 1, Q % n
+    for bit in bin(d)[3:]:
+        U = U * V % n
+        V = (V * V - 2 * Qk) % n
+        Qk = Qk * Qk % n
+        if bit == "1":
+            U, V = U + V, D * U + V
+            # Halve mod n (n is odd)
+            U = (U + n if U & 1 else U) // 2 % n
+            V = (V + n if V & 1 else V) // 2 % n
+            Qk = Qk * Q % n
+
+    if U == 0 or V == 0:
+        return True
+    for _ in range(s - 1):
+        V = (V * V - 2 * Qk) % n
+        if V == 0:
+            return True
+        Qk = Qk * Qk % n
+    return False
+
+
+def _pollard_brent(n: int) -> int:
+    """Return a nontrivial factor of a composite n (Pollard's rho, Brent)."""
+    for c in itertools.count(1):
+        # Walk y -> y² + c (mod n) in doubling runs of length r, comparing
+        # each y against x, the walk's position at the end of the last run
+        y, r, q, g = 2, 1, 1, 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            for k in range(0, r, _RHO_BATCH):
+                ys = y
+                for _ in range(min(_RHO_BATCH, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                if g != 1:
+                    break
+            r *= 2
+
+        if g == n:
+            # The batch product collapsed to 0 mod n: replay it one gcd at a
+            # time to find the step that revealed the factor
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
+        # The walk cycled mod every factor at once; retry with the next c
+
+
+def _rho_factors(n: int) -> list:
+    """Prime factors, unordered, of a composite n with no factor below 1000."""
+    factor = _pollard_brent(n)
+    factors = []
+    for part in (factor, n // factor):
+        if _is_prime(part):
+            factors.append(part)
+        else:
+            factors += _rho_factors(part)
+    return factors
+
+
+@functools.lru_cache(maxsize=4096)
+def _prime_factors(n: int) -> Tuple[int, ...]:
+    """Prime factors of an int n >= 1 in ascending order, with repetition."""
+    factors = []
+    if n >= _SIEVE_LIMIT:
+        for p in (2, 3, 5):
+            while n % p == 0:
+                factors.append(p)
+                n //= p
+
+        kernels = None
+        bound = _TRIAL_DIVISION_BOUND
+        load_kernels = _JIT_MIN_N <= n < _JIT_MAX_N
+
+        # Strip the smallest factor until the cofactor is prime or fits the
+        # table
+        divisor, step = 7, 0
+        while n >= _SIEVE_LIMIT and not _is_prime(n):
+            if load_kernels:
+                # Only now that a composite cofactor needs trial division, so
+                # primes never pay for importing Numba
+                load_kernels = False
+                kernels = _number_theory_kernels()
+                if kernels is not None:
+                    bound = _TRIAL_DIVISION_BOUND_JIT
+            limit = min(math.isqrt(n), bound)
+            if kernels is not None:
+                divisor = kernels.smallest_factor(n, divisor, limit)
+            else:
+                while divisor <= limit and n % divisor:
+                    divisor += _WHEEL_30[step]
+                    step = (step + 1) & 7
+            if n % divisor:
+                # No factor up to the bound: split the rest with rho
+                factors += sorted(_rho_factors(n))
+                return tuple(factors)
+            while n % divisor == 0:
+                factors.append(divisor)
+                n //= divisor
+
+        if n >= _SIEVE_LIMIT:
+            factors.append(n)
+            return tuple(factors)
+
+    spf = _smallest_prime_factors()
+    while spf[n]:
+        factors.append(spf[n])
+        n //= spf[n]
+    if n > 1:
+        factors.append(n)
+    # Immutable, since the cache hands the same object to every caller
+    return tuple(factors)
+
+
 def is_prime(n: int) -> bool:
     """
     Check if a number is prime.
 
     Detailed Description:
         Determines whether a given positive integer is prime (only divisible by
-        1 and itself). Uses trial division with optimizations: checks divisibility
-        only up to sqrt(n) and skips even numbers after checking 2.
+        1 and itself). Uses the Miller-Rabin test with a witness set that is
+        proven deterministic for n < 3.3 × 10²⁴, and the Baillie-PSW test
+        above that.
 
     Args:
         n (int): Integer to test for primality (must be positive)
@@ -2125,15 +2639,18 @@ def is_prime(n: int) -> bool:
         TypeError: If n is not an integer
 
     Algorithm:
-        1. Handle special cases: n ≤ 1 (not prime), n = 2 (prime), even n (not prime)
-        2. Check odd divisors from 3 to sqrt(n)
-        3. If any divisor found, not prime; otherwise prime
-
-        Optimization: Only check up to sqrt(n) because if n = a*b and a ≤ b,
-        then a ≤ sqrt(n)
+        1. Handle special cases: n = 1 (not prime), n < 1000 (set lookup),
+           n < 10⁶ (smallest-prime-factor table lookup)
+        2. Reject n sharing a factor with the primes below 1000 (one gcd)
+        3. Write n - 1 = d × 2^s and run Miller-Rabin with the first k primes
+           as witnesses, k chosen by the size of n (2 to 41 at most)
+        4. Above 3.3 × 10²⁴ no witness set is proven, so a passing n must
+           also pass a strong Lucas test (Selfridge parameters), which with
+           the base-2 witness makes up Baillie-PSW
 
     Complexity:
-        Time: O(√n) - Trial division up to square root
+        Time: O(k log³ n) (k ≤ 13 witnesses, plus one Lucas test above
+            3.3 × 10²⁴)
         Space: O(1) - Constant space
 
     Special Cases:
@@ -2164,6 +2681,9 @@ def is_prime(n: int) -> bool:
         >>> is_prime(1)
         False
 
+        >>> is_prime(2**89 - 1)
+        True
+
         >>> is_prime(0)
         False
 
@@ -2178,11 +2698,11 @@ def is_prime(n: int) -> bool:
         - gcd: Greatest common divisor
 
     Notes:
-        - This is a deterministic primality test
-        - For large numbers, consider probabilistic tests (Miller-Rabin)
+        - Deterministic below 3.3 × 10²⁴; above it the result is a
+          Baillie-PSW probable prime (no counterexample is known)
+        - Witness bounds: Jaeschke (1993), Sorenson & Webster (2015)
         - 2 is the only even prime number
         - All primes > 2 are odd
-        - Trial division is simple but not fastest for large n
 
     Prime Numbers:
         First few primes: 2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47...
@@ -2197,7 +2717,7 @@ def is_prime(n: int) -> bool:
 
     Advanced Algorithms:
         For production systems with large numbers, consider:
-        - Miller-Rabin (probabilistic, O(k log³ n))
+        - ECPP (primality certificates, beyond 3.3 × 10²⁴)
         - AKS primality test (deterministic, polynomial time)
         - Sieve of Eratosthenes (for finding all primes up to n)
 
@@ -2214,21 +2734,10 @@ def is_prime(n: int) -> bool:
     if n < 1:
         raise ValueError("Input must be a positive integer")
 
-    # Special cases
-    if n <= 1:
-        return False
-    if n == 2:
-        return True
-    if n % 2 == 0:
+    if n == 1:
         return False
 
-    # Trial division for odd numbers up to sqrt(n)
-    limit = int(math.sqrt(n)) + 1
-    for divisor in range(3, limit, 2):
-        if n % divisor == 0:
-            return False
-
-    return True
+    return _is_prime(n)
 
 
 def prime_factors(n: int) -> list[int]:
@@ -2238,7 +2747,9 @@ def prime_factors(n: int) -> list[int]:
     Detailed Description:
         Computes the prime factorization of a positive integer, returning a list
         of all prime factors (with repetition). For example, 12 = 2² × 3 returns
-        [2, 2, 3]. Uses trial division algorithm.
+        [2, 2, 3]. Uses wheel trial division for small factors and Pollard's
+        rho for large ones, stopping as soon as the remaining cofactor is
+        prime.
 
     Args:
         n (int): Positive integer to factor (must be > 0)
@@ -2253,14 +2764,23 @@ def prime_factors(n: int) -> list[int]:
         TypeError: If n is not an integer
 
     Algorithm:
-        1. Divide by 2 as many times as possible
-        2. Try odd divisors from 3 upward
-        3. When a divisor is found, divide and repeat
-        4. Continue until quotient becomes 1
-        5. Remaining quotient (if > 1) is a prime factor
+        1. Divide out 2, 3 and 5 as many times as possible
+        2. While the quotient is composite (is_prime), find its smallest
+           factor by trying divisors coprime to 30 (the mod-30 wheel, 8 of
+           every 30 integers) and divide it out
+        3. If no divisor up to 2¹⁰ divides a composite quotient, split it
+           with Pollard's rho (Brent's variant) and factor the parts the
+           same way
+        4. Remaining quotient (if > 1) is a prime factor
+
+        Once the quotient is below 10⁶ its factors are read from a
+        smallest-prime-factor table instead. For 2²⁰ ≤ n < 2⁶³ the divisor
+        search runs in a Numba-compiled kernel when Numba is installed,
+        up to 2¹⁶ before switching to rho
 
     Complexity:
-        Time: O(√n) - Trial division up to square root
+        Time: O(√p) expected, where p is the second-largest prime factor
+            (rho finds a factor p in about √p steps)
         Space: O(log n) - At most log₂(n) factors (all 2's worst case)
 
     Special Cases:
@@ -2293,6 +2813,9 @@ def prime_factors(n: int) -> list[int]:
         >>> prime_factors(360)
         [2, 2, 2, 3, 3, 5]
 
+        >>> prime_factors((2**31 - 1) * (2**89 - 1))
+        [2147483647, 618970019642690137449562111]
+
     See Also:
         - is_prime: Check if number is prime
         - divisors: Find all divisors (not just prime)
@@ -2303,6 +2826,8 @@ def prime_factors(n: int) -> list[int]:
         - Result is always sorted in ascending order
         - Product of returned factors equals n
         - For n = 1, returns empty list (convention)
+        - Factors above 3.3 × 10²⁴ are Baillie-PSW probable primes (see
+          is_prime)
         - Fundamental theorem: Every integer > 1 has unique prime factorization
 
     Mathematical Properties:
@@ -2338,26 +2863,7 @@ def prime_factors(n: int) -> list[int]:
     if n == 1:
         return []
 
-    factors = []
-
-    # Divide by 2 as many times as possible
-    while n % 2 == 0:
-        factors.append(2)
-        n //= 2
-
-    # Try odd divisors starting from 3
-    divisor = 3
-    while divisor * divisor <= n:
-        while n % divisor == 0:
-            factors.append(divisor)
-            n //= divisor
-        divisor += 2
-
-    # If n is still greater than 1, it's a prime factor
-    if n > 1:
-        factors.append(n)
-
-    return factors
+    return list(_prime_factors(n))
 
 
 def divisors(n: int) -> list[int]:
@@ -2382,14 +2888,13 @@ def divisors(n: int) -> list[int]:
         TypeError: If n is not an integer
 
     Algorithm:
-        1. Check all integers from 1 to sqrt(n)
-        2. For each i where n % i == 0:
-           - Add i as a divisor
-           - Add n/i as a divisor (unless i = n/i)
+        1. Factor n = p₁^k₁ × p₂^k₂ × ... with prime_factors()
+        2. Starting from [1], for each prime p append p, p², ..., p^k times
+           every divisor found so far
         3. Sort the result
 
     Complexity:
-        Time: O(√n) - Check divisors up to square root
+        Time: O(√p + d(n) log d(n)) - Factorization, then generation and sort
         Space: O(d(n)) - Where d(n) is the number of divisors
 
     Special Cases:
@@ -2468,18 +2973,16 @@ def divisors(n: int) -> list[int]:
     if n < 1:
         raise ValueError(f"Input must be a positive integer, got {n}")
 
-    divs = []
-
-    # Find divisors up to sqrt(n)
-    limit = int(math.sqrt(n)) + 1
-    for i in range(1, limit):
-        if n % i == 0:
-            divs.append(i)
-            # Add the complementary divisor (n/i) if it's different
-            if i != n // i:
-                divs.append(n // i)
+    # Expand n = p1^k1 × p2^k2 × ... into every product p1^e1 × p2^e2 × ...
+    # with 0 <= ei <= ki
+    divs = [1]
+    prime, power_divs = None, []
+    for p in _prime_factors(n):
+        if p != prime:
+            prime, power_divs = p, divs
+        power_divs = [d * p for d in power_divs]
+        divs += power_divs
 
-    # Sort and return
     return sorted(divs)
 
 
@@ -2515,7 +3018,7 @@ def totient(n: int) -> int:
         3. Simplify: φ(n) = n × (p₁-1)/p₁ × (p₂-1)/p₂ × ...
 
     Complexity:
-        Time: O(√n) - Dominated by prime factorization
+        Time: O(√p) - Dominated by prime_factors()
         Space: O(log n) - Storage for unique prime factors
 
     Special Cases:
@@ -2602,35 +3105,69 @@ def totient(n: int) -> int:
     if n == 1:
         return 1
 
-    # Start with result = n
+    # Euler's product formula over the distinct prime factors
+    # φ(n) = n × ∏(1 - 1/p) = n × ∏((p-1)/p)
     result = n
+    for p in dict.fromkeys(_prime_factors(n)):
+        result -= result // p  # Multiply by (1 - 1/p)
 
-    # Find unique prime factors and apply Euler's product formula
-    # φ(n) = n × ∏(1 - 1/p) = n × ∏((p-1)/p)
+    return result
 
-    # Divide by 2 as many times as possible
-    if n % 2 == 0:
-        result -= result // 2  # Multiply by (1 - 1/2) = 1/2
-        while n % 2 == 0:
-            n //= 2
-
-    # Try odd divisors
-    divisor = 3
-    while divisor * divisor <= n:
-        if n % divisor == 0:
-            result -= result // divisor  # Multiply by (1 - 1/divisor)
-            while n % divisor == 0:
-                n //= divisor
-        divisor += 2
 
-    # If n is still > 1, then it's a prime factor
-    if n > 1:
-        result -= result // n  # Multiply by (1 - 1/n)
+# ===== ADVANCED ARITHMETIC OPERATIONS =====
+
+
+@functools.lru_cache(maxsize=1)
+def _libm_fma() -> Optional[Callable[[float, float, float], float]]:
+    """Load the C library's fma() through ctypes (None if unavailable)."""
+    import ctypes
+
+    try:
+        func = ctypes.CDLL(None).fma
+    except (OSError, TypeError, AttributeError):
+        return None
+    func.argtypes = (ctypes.c_double,) * 3
+    func.restype = ctypes.c_double
+    return func
+
 
+def _fma_fallback(a: Number, b: Number, c: Number) -> float:
+    """
+    math.fma() for Python < 3.13, with the same single rounding and errors.
+
+    Uses the C library's fma() when ctypes can load it, otherwise computes
+    a*b + c exactly with rationals and rounds once on conversion to float.
+    """
+    libm_fma = _libm_fma()
+    if libm_fma is not None:
+        result = libm_fma(a, b, c)
+    elif math.isfinite(a) and math.isfinite(b) and math.isfinite(c):
+        from fractions import Fraction
+
+        exact = Fraction(a) * Fraction(b) + Fraction(c)
+        if not exact:
+            # a*b == -c exactly, so the float expression is exact too and
+            # gets the IEEE sign of zero right
+            result = a * b + c
+        else:
+            try:
+                result = float(exact)
+            except OverflowError:
+                result = math.inf
+    elif math.isinf(c) and math.isfinite(a) and math.isfinite(b):
+        result = float(c)
+    else:
+        # An infinite factor makes a*b exact, so one rounding either way
+        result = a * b + c
+
+    if result != result and not (a != a or b != b or c != c):
+        raise ValueError("invalid operation in fma")
+    if math.isinf(result) and math.isfinite(a) and math.isfinite(b) and math.isfinite(c):
+        raise OverflowError("overflow in fma")
     return result
 
 
-# ===== ADVANCED ARITHMETIC OPERATIONS =====
+_fma = getattr(math, "fma", _fma_fallback)
 
 
 def fma(a: Number, b: Number, c: Number) -> float:
@@ -2652,8 +3189,10 @@ def fma(a: Number, b: Number, c: Number) -> float:
         float: Result of a*b + c with single rounding
 
     Algorithm:
-        Uses math.fma() which leverages hardware FMA instructions when
-        available, or implements high-precision software fallback
+        Uses math.fma() (Python 3.13+), which leverages hardware FMA
+        instructions when available. On older Pythons calls the C library
+        fma() through ctypes, or as a last resort computes a*b + c exactly
+        with fractions.Fraction and rounds once
 
     Complexity:
         Time: O(1) - Constant time, often single CPU instruction
@@ -2674,8 +3213,8 @@ def fma(a: Number, b: Number, c: Number) -> float:
         >>> fma(0.1, 10.0, 0.5)
         1.5
 
-        >>> fma(1e308, 2.0, 1e308)
-        3e+308
+        >>> fma(1e308, 2.0, -1e308)  # 1e308 * 2.0 alone would overflow
+        1e+308
 
         >>> # Demonstrates increased precision
         >>> a, b, c = 1e16, 1.0, -1e16
@@ -2736,7 +3275,7 @@ def fma(a: Number, b: Number, c: Number) -> float:
         return float('nan')
 
     # Use math.fma for hardware acceleration and accuracy
-    return float(math.fma(a, b, c))
+    return float(_fma(a, b, c))
 
 
 def hypot(*values: Number) -> float:
@@ -2804,6 +3343,7 @@ def hypot(*values: Number) -> float:
         - safe_sqrt: Square root with checking
         - fma: Fused multiply-add
         - safe_power: General exponentiation
+        - batch.hypot_array: Element-wise two-argument hypot over arrays
 
     Notes:
         - Avoids intermediate overflow/underflow
@@ -2976,7 +3516,7 @@ def lerp(a: Number, b: Number, t: Number) -> float:
         float: Interpolated value a + t*(b - a)
 
     Algorithm:
-        Uses formula: a + t*(b - a)
+        Uses formula: a + t*(b - a), returning b itself at t = 1
         Alternative (numerically equivalent): (1-t)*a + t*b
 
     Complexity:
@@ -3015,6 +3555,7 @@ def lerp(a: Number, b: Number, t: Number) -> float:
     See Also:
         - clamp: Clamp value to range
         - fma: Fused multiply-add (can implement lerp)
+        - batch.lerp_array: Element-wise lerp over arrays
         - safe_add, safe_multiply: Arithmetic operations
 
     Notes:
@@ -3067,6 +3608,8 @@ def lerp(a: Number, b: Number, t: Number) -> float:
     if math.isnan(a) or math.isnan(b) or math.isnan(t):
         return float('nan')
 
-    # Formula: a + t*(b - a)
-    # This ensures exact results at t=0 and t=1
+    # a + t*(b - a) is exact at t=0 but can miss b at t=1 when b - a rounds
+    # (lerp(1e16, 1.0, 1) would give 0.0), so that endpoint is returned as is
+    if t == 1:
+        return float(b)
     return float(a + t * (b - a))
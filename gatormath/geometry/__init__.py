@@ -24,6 +24,8 @@ Usage:
 Contents:
     Submodules:
         - shapes2d: 2D geometric shapes (Circle, Rectangle, Square, Triangle)
+        - soa: Structure-of-arrays shape batches (CircleArray, RectangleArray,
+          TriangleArray); imported on demand since it requires NumPy
         - shapes3d: 3D geometric shapes (future)
         - transforms: Geometric transformations (future)
         - spatial: Spatial algorithms (future)
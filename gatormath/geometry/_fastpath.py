@@ -0,0 +1,87 @@
+"""
+Metadata:
+    Project: GatorMath
+    File Name: _fastpath.py
+    File Path: gatormath/geometry/_fastpath.py
+    Module: Geometry Batch Kernels
+    Created: 2026-10-16
+    Modified: 2026-10-16
+    Version: 0.1.0
+    Author: Dennis 'dnoice' Smaltz
+    AI Acknowledgement: Claude Code
+
+Description:
+    Array kernels behind the batch methods of gatormath.geometry.shapes2d.
+    When Numba is installed the kernels are JIT-compiled (and cached on
+    disk); otherwise equivalent NumPy expressions are used.
+
+Usage:
+    >>> import numpy as np
+    >>> from gatormath.geometry import _fastpath
+    >>> _fastpath.circle_areas(np.array([1.0, 2.0]))
+    array([ 3.14159265, 12.56637061])
+
+Contents:
+    Constants:
+        - HAS_NUMBA: True if Numba is available
+
+    Functions:
+        - circle_areas: Areas of circles from an array of radii
+        - triangle_areas: Areas of triangles from arrays of side lengths
+
+Dependencies:
+    - numpy: Array operations
+    - numba: Optional JIT compilation (pip install gatormath[fast])
+
+Notes:
+    Private module: inputs are assumed validated, contiguous float64 arrays.
+    Use Circle.area_batch() and Triangle.area_batch() instead.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    import numba
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+
+    @numba.njit(cache=True, fastmath=True)
+    def circle_areas(radii: np.ndarray) -> np.ndarray:
+        out = np.empty_like(radii)
+        for i in range(radii.shape[0]):
+            out[i] = math.pi * (radii[i] * radii[i])
+        return out
+
+    # No fastmath: reassociation would break Kahan's parenthesization
+    @numba.njit(cache=True)
+    def triangle_areas(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+        out = np.empty_like(a)
+        for i in range(a.shape[0]):
+            x, y, z = a[i], b[i], c[i]
+            # Sort so that x >= y >= z
+            if x < y:
+                x, y = y, x
+            if y < z:
+                y, z = z, y
+            if x < y:
+                x, y = y, x
+            out[i] = 0.25 * math.sqrt(
+                (x + (y + z)) * (z - (x - y)) * (z + (x - y)) * (x + (y - z))
+            )
+        return out
+
+else:
+
+    def circle_areas(radii: np.ndarray) -> np.ndarray:
+        return math.pi * (radii * radii)
+
+    def triangle_areas(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+        z, y, x = np.sort(np.stack((a, b, c)), axis=0)
+        return 0.25 * np.sqrt((x + (y + z)) * (z - (x - y)) * (z + (x - y)) * (x + (y - z)))
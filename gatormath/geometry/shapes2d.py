@@ -36,6 +36,8 @@ Dependencies:
     - math: Standard library math functions
     - typing: Type hints
     - gatormath.precision.comparison: Floating-point comparison utilities
+    - numpy: Batch methods only (imported on first use)
+    - numba: Optional JIT for batch methods (pip install gatormath[fast])
 
 References:
     [1] Euclidean geometry principles
@@ -47,10 +49,16 @@ Notes:
 """
 
 import math
-from typing import Literal
+from math import pi as _PI
+from math import tau as _TAU
+from typing import TYPE_CHECKING, Literal
 
 from gatormath.precision.comparison import is_close, is_zero
 
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import ArrayLike
+
 
 class Circle:
     """
@@ -68,6 +76,7 @@ class Circle:
         area: Calculate circle area (πr²)
         circumference: Calculate circle circumference (2πr)
         diameter: Calculate circle diameter (2r)
+        area_batch: Calculate areas for an array of radii
 
     Mathematical Formulation:
         Area = πr²
@@ -149,7 +158,8 @@ class Circle:
 
         Version: 0.1.0
         """
-        return math.pi * self.radius ** 2
+        radius = self.radius
+        return _PI * (radius * radius)
 
     def circumference(self) -> float:
         """
@@ -172,7 +182,7 @@ class Circle:
 
         Version: 0.1.0
         """
-        return 2.0 * math.pi * self.radius
+        return _TAU * self.radius
 
     def diameter(self) -> float:
         """
@@ -194,6 +204,39 @@ class Circle:
         """
         return 2.0 * self.radius
 
+    @staticmethod
+    def area_batch(radii: "ArrayLike") -> "np.ndarray":
+        """
+        Calculate areas for many circles at once.
+
+        Args:
+            radii (ArrayLike): One-dimensional sequence of radii (each >= 0)
+
+        Returns:
+            np.ndarray: Array of areas (πr²), same length as radii
+
+        Raises:
+            ValueError: If radii is not one-dimensional or any radius is negative
+
+        Algorithm:
+            Numba-compiled loop when Numba is installed, otherwise a
+            vectorized NumPy expression (see geometry._fastpath)
+
+        Complexity:
+            Time: O(n)
+            Space: O(n)
+
+        Examples:
+            >>> Circle.area_batch([1.0, 5.0])
+            array([ 3.14159265, 78.53981634])
+
+        Version: 0.1.0
+        """
+        from gatormath.geometry import _fastpath
+        from gatormath.geometry.soa import CircleArray
+
+        return _fastpath.circle_areas(CircleArray(radii).radii)
+
     def __repr__(self) -> str:
         return f"Circle(radius={self.radius})"
 
@@ -347,8 +390,9 @@ class Triangle:
     Detailed Description:
         Represents a triangle defined by three side lengths. Validates
         triangle inequality theorem. Provides comprehensive methods for
-        area calculation (Heron's formula), perimeter, angle calculations,
-        and triangle type classification.
+        area calculation (Heron's formula in Kahan's numerically stable
+        form), perimeter, angle calculations, and triangle type
+        classification.
 
     Attributes:
         a (float): First side length
@@ -356,16 +400,18 @@ class Triangle:
         c (float): Third side length
 
     Methods:
-        area: Calculate area using Heron's formula
+        area: Calculate area using Heron's formula (Kahan's stable form)
         perimeter: Calculate perimeter (a + b + c)
         is_valid: Check if sides form valid triangle
         is_right_triangle: Check if triangle is right-angled
         is_equilateral: Check if all sides are equal
         is_isosceles: Check if two sides are equal
         triangle_type: Classify triangle type
+        area_batch: Calculate areas for arrays of side lengths
 
     Mathematical Formulation:
         Area = √(s(s-a)(s-b)(s-c)) where s = (a+b+c)/2 (Heron's formula)
+        Evaluated as ¼√((x+(y+z))(z-(x-y))(z+(x-y))(x+(y-z))) with x ≥ y ≥ z
         Triangle Inequality: a + b > c, b + c > a, a + c > b
 
     Examples:
@@ -404,8 +450,9 @@ class Triangle:
         if a <= 0 or b <= 0 or c <= 0:
             raise ValueError("All sides must be positive")
 
-        # Check triangle inequality
-        if not (a + b > c and b + c > a and a + c > b):
+        # Check triangle inequality: fold all three comparisons (bool & bool)
+        # and branch once; written with > so NaN sides also fail
+        if not ((a + b > c) & (b + c > a) & (a + c > b)):
             raise ValueError(
                 f"Sides do not satisfy triangle inequality: {a}, {b}, {c}"
             )
@@ -419,8 +466,14 @@ class Triangle:
         Calculate triangle area using Heron's formula.
 
         Algorithm:
-            s = (a + b + c) / 2  (semi-perimeter)
-            Area = √(s(s-a)(s-b)(s-c))
+            Kahan's rearrangement of Heron's formula, with sides sorted so
+            that x ≥ y ≥ z:
+            Area = ¼√((x+(y+z))(z-(x-y))(z+(x-y))(x+(y-z)))
+            The parenthesization must be kept as written
+
+        Precision:
+            Stable for needle-like triangles, where the classic
+            √(s(s-a)(s-b)(s-c)) form loses precision to cancellation in s-a
 
         Complexity:
             Time: O(1)
@@ -432,8 +485,8 @@ class Triangle:
 
         Version: 0.1.0
         """
-        s = (self.a + self.b + self.c) / 2.0
-        return math.sqrt(s * (s - self.a) * (s - self.b) * (s - self.c))
+        z, y, x = sorted((self.a, self.b, self.c))
+        return 0.25 * math.sqrt((x + (y + z)) * (z - (x - y)) * (z + (x - y)) * (x + (y - z)))
 
     def perimeter(self) -> float:
         """Calculate triangle perimeter."""
@@ -453,8 +506,8 @@ class Triangle:
 
         Version: 0.1.0
         """
-        sides = sorted([self.a, self.b, self.c])
-        return is_close(sides[0] ** 2 + sides[1] ** 2, sides[2] ** 2)
+        z, y, x = sorted((self.a, self.b, self.c))
+        return is_close(z * z + y * y, x * x)
 
     def is_equilateral(self) -> bool:
         """Check if all sides are equal."""
@@ -466,6 +519,43 @@ class Triangle:
                 is_close(self.b, self.c) or
                 is_close(self.a, self.c))
 
+    @staticmethod
+    def area_batch(a: "ArrayLike", b: "ArrayLike", c: "ArrayLike") -> "np.ndarray":
+        """
+        Calculate areas for many triangles at once.
+
+        Args:
+            a (ArrayLike): One-dimensional sequence of first side lengths
+            b (ArrayLike): One-dimensional sequence of second side lengths
+            c (ArrayLike): One-dimensional sequence of third side lengths
+
+        Returns:
+            np.ndarray: Array of areas, one per (a[i], b[i], c[i]) triple
+
+        Raises:
+            ValueError: If the arrays are not one-dimensional and equal length
+            ValueError: If any side is non-positive or a triple fails the
+                triangle inequality
+
+        Algorithm:
+            Builds a soa.TriangleArray and evaluates the same Kahan form of
+            Heron's formula as area(): a Numba-compiled loop when available,
+            otherwise NumPy
+
+        Complexity:
+            Time: O(n)
+            Space: O(n)
+
+        Examples:
+            >>> Triangle.area_batch([3.0, 5.0], [4.0, 5.0], [5.0, 6.0])
+            array([ 6., 12.])
+
+        Version: 0.1.0
+        """
+        from gatormath.geometry.soa import TriangleArray
+
+        return TriangleArray(a, b, c).areas()
+
     def triangle_type(self) -> Literal["equilateral", "isosceles", "scalene"]:
         """
         Classify triangle type based on side lengths.
@@ -0,0 +1,260 @@
+"""
+Metadata:
+    Project: GatorMath
+    File Name: soa.py
+    File Path: gatormath/geometry/soa.py
+    Module: Batched 2D Shapes
+    Created: 2026-10-16
+    Modified: 2026-10-16
+    Version: 0.1.0
+    Author: Dennis 'dnoice' Smaltz
+    AI Acknowledgement: Claude Code
+
+Description:
+    Structure-of-arrays counterparts to the shapes in shapes2d. Each class
+    stores one contiguous float64 array per dimension instead of one Python
+    object per shape, so properties of thousands of shapes are computed in a
+    single vectorized pass.
+
+Usage:
+    >>> from gatormath.geometry.soa import CircleArray
+    >>> circles = CircleArray([1.0, 2.0, 5.0])
+    >>> circles.areas()
+    array([ 3.14159265, 12.56637061, 78.53981634])
+
+    >>> import numpy as np
+    >>> buf = np.empty(3)
+    >>> circles.circumferences(out=buf) is buf
+    True
+
+Contents:
+    Classes:
+        - CircleArray: Batch of circles given by radii
+        - RectangleArray: Batch of rectangles given by widths and heights
+        - TriangleArray: Batch of triangles given by three side arrays
+
+Dependencies:
+    - numpy: Array storage and vectorized arithmetic
+    - gatormath.geometry._fastpath: Triangle area kernel
+
+Notes:
+    Inputs are validated with the same rules as the shapes2d constructors
+    Every method accepts an optional `out` array to reuse a buffer
+"""
+
+import math
+from typing import Optional
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from gatormath.geometry import _fastpath
+
+
+def _as_column(values: ArrayLike, name: str) -> np.ndarray:
+    """Convert values to a contiguous one-dimensional float64 array."""
+    array = np.ascontiguousarray(values, dtype=np.float64)
+    if array.ndim != 1:
+        raise ValueError(f"{name} must be one-dimensional, got shape {array.shape}")
+    return array
+
+
+class CircleArray:
+    """
+    Batch of circles stored as a radius array.
+
+    Attributes:
+        radii (np.ndarray): Circle radii (each >= 0)
+
+    Methods:
+        areas: Areas of all circles (πr²)
+        circumferences: Circumferences of all circles (2πr)
+        diameters: Diameters of all circles (2r)
+
+    Examples:
+        >>> CircleArray([5.0]).areas()
+        array([78.53981634])
+
+    Version: 0.1.0
+    """
+
+    def __init__(self, radii: ArrayLike) -> None:
+        """
+        Initialize CircleArray with radii.
+
+        Args:
+            radii (ArrayLike): One-dimensional sequence of radii
+
+        Raises:
+            ValueError: If radii is not one-dimensional or any radius is negative
+
+        Version: 0.1.0
+        """
+        radii = _as_column(radii, "Radii")
+        if (radii < 0).any():
+            raise ValueError("Radius must be non-negative")
+
+        self.radii = radii
+
+    def __len__(self) -> int:
+        return len(self.radii)
+
+    def areas(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Calculate areas of all circles (πr²)."""
+        out = np.multiply(self.radii, self.radii, out=out)
+        out *= math.pi
+        return out
+
+    def circumferences(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Calculate circumferences of all circles (2πr)."""
+        return np.multiply(self.radii, math.tau, out=out)
+
+    def diameters(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Calculate diameters of all circles (2r)."""
+        return np.multiply(self.radii, 2.0, out=out)
+
+    def __repr__(self) -> str:
+        return f"CircleArray(n={len(self)})"
+
+
+class RectangleArray:
+    """
+    Batch of rectangles stored as width and height arrays.
+
+    Attributes:
+        widths (np.ndarray): Rectangle widths (each >= 0)
+        heights (np.ndarray): Rectangle heights (each >= 0)
+
+    Methods:
+        areas: Areas of all rectangles (w × h)
+        perimeters: Perimeters of all rectangles (2(w + h))
+        diagonals: Diagonal lengths of all rectangles (√(w² + h²))
+
+    Examples:
+        >>> RectangleArray([4.0], [3.0]).diagonals()
+        array([5.])
+
+    Version: 0.1.0
+    """
+
+    def __init__(self, widths: ArrayLike, heights: ArrayLike) -> None:
+        """
+        Initialize RectangleArray with widths and heights.
+
+        Args:
+            widths (ArrayLike): One-dimensional sequence of widths
+            heights (ArrayLike): One-dimensional sequence of heights
+
+        Raises:
+            ValueError: If the arrays are not one-dimensional and equal length
+            ValueError: If any width or height is negative
+
+        Version: 0.1.0
+        """
+        widths = _as_column(widths, "Widths")
+        heights = _as_column(heights, "Heights")
+        if widths.shape != heights.shape:
+            raise ValueError(
+                f"Widths and heights must have equal length, "
+                f"got {len(widths)} and {len(heights)}"
+            )
+        if (widths < 0).any():
+            raise ValueError("Width must be non-negative")
+        if (heights < 0).any():
+            raise ValueError("Height must be non-negative")
+
+        self.widths = widths
+        self.heights = heights
+
+    def __len__(self) -> int:
+        return len(self.widths)
+
+    def areas(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Calculate areas of all rectangles (w × h)."""
+        return np.multiply(self.widths, self.heights, out=out)
+
+    def perimeters(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Calculate perimeters of all rectangles (2(w + h))."""
+        out = np.add(self.widths, self.heights, out=out)
+        out *= 2.0
+        return out
+
+    def diagonals(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Calculate diagonal lengths of all rectangles (√(w² + h²))."""
+        return np.hypot(self.widths, self.heights, out=out)
+
+    def __repr__(self) -> str:
+        return f"RectangleArray(n={len(self)})"
+
+
+class TriangleArray:
+    """
+    Batch of triangles stored as three side-length arrays.
+
+    Attributes:
+        a (np.ndarray): First side lengths (each > 0)
+        b (np.ndarray): Second side lengths (each > 0)
+        c (np.ndarray): Third side lengths (each > 0)
+
+    Methods:
+        areas: Areas of all triangles (Kahan's form of Heron's formula)
+        perimeters: Perimeters of all triangles (a + b + c)
+
+    Examples:
+        >>> TriangleArray([3.0], [4.0], [5.0]).areas()
+        array([6.])
+
+    Version: 0.1.0
+    """
+
+    def __init__(self, a: ArrayLike, b: ArrayLike, c: ArrayLike) -> None:
+        """
+        Initialize TriangleArray with three side-length arrays.
+
+        Args:
+            a (ArrayLike): One-dimensional sequence of first side lengths
+            b (ArrayLike): One-dimensional sequence of second side lengths
+            c (ArrayLike): One-dimensional sequence of third side lengths
+
+        Raises:
+            ValueError: If the arrays are not one-dimensional and equal length
+            ValueError: If any side is non-positive or a triple fails the
+                triangle inequality
+
+        Version: 0.1.0
+        """
+        a = _as_column(a, "Sides")
+        b = _as_column(b, "Sides")
+        c = _as_column(c, "Sides")
+        if a.shape != b.shape or a.shape != c.shape:
+            raise ValueError(
+                f"Sides must have equal length, got {len(a)}, {len(b)}, {len(c)}"
+            )
+        if (a <= 0).any() or (b <= 0).any() or (c <= 0).any():
+            raise ValueError("All sides must be positive")
+        if not ((a + b > c) & (b + c > a) & (a + c > b)).all():
+            raise ValueError("Sides do not satisfy triangle inequality")
+
+        self.a = a
+        self.b = b
+        self.c = c
+
+    def __len__(self) -> int:
+        return len(self.a)
+
+    def areas(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Calculate areas of all triangles (Kahan's form of Heron's formula)."""
+        result = _fastpath.triangle_areas(self.a, self.b, self.c)
+        if out is None:
+            return result
+        out[...] = result
+        return out
+
+    def perimeters(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Calculate perimeters of all triangles (a + b + c)."""
+        out = np.add(self.a, self.b, out=out)
+        out += self.c
+        return out
+
+    def __repr__(self) -> str:
+        return f"TriangleArray(n={len(self)})"
@@ -84,9 +84,13 @@ def is_close(
     Returns:
         bool: True if values are within tolerance, False otherwise
 
+    Raises:
+        ValueError: If rel_tol or abs_tol is negative
+
     Algorithm:
         Returns True if:
         abs(a - b) <= max(rel_tol * max(abs(a), abs(b)), abs_tol)
+        Evaluated by math.isclose() in a single C call
 
     Precision:
         Uses both relative and absolute tolerance to handle:
@@ -123,16 +127,8 @@ def is_close(
 
     Version: 0.1.0
     """
-    # Handle NaN
-    if math.isnan(a) or math.isnan(b):
-        return False
-
-    # Handle infinity
-    if math.isinf(a) or math.isinf(b):
-        return a == b
-
-    # Standard tolerance check
-    return abs(a - b) <= max(rel_tol * max(abs(a), abs(b)), abs_tol)
+    # math.isclose applies the same NaN/infinity rules and tolerance formula
+    return math.isclose(a, b, rel_tol=rel_tol, abs_tol=abs_tol)
 
 
 def is_zero(value: Number, tolerance: float = DEFAULT_EPSILON) -> bool: